@@ -1,85 +1,55 @@
-# Planning
-from .planning.local_fast_downward import LocalFastDownward
-from .planning.planner import Planner, PlanningFailure, PlanningTimeout
-from .planning.pddl_planner import PDDLPlanner
+import importlib
 
-# Validation
-from .validation.local_val import LocalVAL
+# Public symbols are imported on first access (PEP 562), so e.g. ``parse_domain``
+# does not pull in the planners, validators or the docker SDK.
+_LAZY = {
+    # Planning
+    "LocalFastDownward": "pddl_utils.planning.local_fast_downward",
+    "DockerFastDownward": "pddl_utils.planning.docker_fast_downward",
+    "Planner": "pddl_utils.planning.planner",
+    "PlanningFailure": "pddl_utils.planning.planner",
+    "PlanningTimeout": "pddl_utils.planning.planner",
+    "PDDLPlanner": "pddl_utils.planning.pddl_planner",
+    # Validation
+    "LocalVAL": "pddl_utils.validation.local_val",
+    "DockerVAL": "pddl_utils.validation.docker_val",
+    "VAL": "pddl_utils.validation.val",
+    "AIValidator": "pddl_utils.validation.ai_validator",
+    # Structs
+    "AbstractState": "pddl_utils.structs",
+    "Operator": "pddl_utils.structs",
+    "GroundOperator": "pddl_utils.structs",
+    "Predicate": "pddl_utils.structs",
+    "NamedPredicate": "pddl_utils.structs",
+    "Type": "pddl_utils.structs",
+    "Object": "pddl_utils.structs",
+    "GroundAtom": "pddl_utils.structs",
+    "Variable": "pddl_utils.structs",
+    "Not": "pddl_utils.structs",
+    "LiteralConjunction": "pddl_utils.structs",
+    "LiteralDisjunction": "pddl_utils.structs",
+    "LiftedFormula": "pddl_utils.structs",
+    "ForAll": "pddl_utils.structs",
+    "Exists": "pddl_utils.structs",
+    "PDDLDomain": "pddl_utils.structs",
+    "PDDLProblem": "pddl_utils.structs",
+    "parse_domain": "pddl_utils.structs",
+    "parse_problem": "pddl_utils.structs",
+    "SasAction": "pddl_utils.structs",
+    "SasPlan": "pddl_utils.structs",
+}
 
-found_docker = False
-try:
-    import docker  # type: ignore
-    found_docker = True
-except ImportError:
-    pass
+__all__ = list(_LAZY)
 
-if found_docker:
-    try:
-        from .planning.docker_fast_downward import DockerFastDownward
-        from .validation.docker_val import DockerVAL
-    except ImportError:
-        pass
-from .validation.val import VAL
-from .validation.ai_validator import AIValidator
 
-# Structs
-from .structs import (
-    AbstractState,
-    Operator,
-    GroundOperator,
-    Predicate,
-    NamedPredicate,
-    Type,
-    Object,
-    GroundAtom,
-    Variable,
-    LiteralConjunction,
-    LiteralDisjunction,
-    LiftedFormula,
-    ForAll,
-    Not,
-    Exists,
-    PDDLDomain,
-    PDDLProblem,
-    parse_domain,
-    parse_problem,
-    SasAction,
-    SasPlan,
-)
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Docker-backed classes raise ImportError here when the docker SDK is missing.
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    # Planning
-    "LocalFastDownward",
-    "DockerFastDownward",
-    "Planner",
-    "PlanningFailure",
-    "PlanningTimeout",
-    "PDDLPlanner",
-    # Validation
-    "LocalVAL",
-    "DockerVAL",
-    "VAL",
-    "AIValidator",
-    # Structs
-    "AbstractState",
-    "Operator",
-    "GroundOperator",
-    "Predicate",
-    "NamedPredicate",
-    "Type",
-    "Object",
-    "GroundAtom",
-    "Variable",
-    "Not",
-    "LiteralConjunction",
-    "LiteralDisjunction",
-    "LiftedFormula",
-    "ForAll",
-    "Exists",
-    "PDDLDomain",
-    "PDDLProblem",
-    "parse_domain",
-    "parse_problem",
-    "SasAction",
-    "SasPlan",
-]
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,7 @@ from typing import Generator
 
 from pddl_utils.structs.pddl_structs import PDDLDomain, PDDLProblem
 from pddl_utils.structs.sas_structs import SasAction, SasPlan
-from pddl_utils.utils.structs_functs import get_substitutions, transition
+from pddl_utils.utils.structs_functs import _object_tuples, _sorted_objects_by_type, transition
 
 
 def plan_generator(
@@ -23,6 +23,8 @@ def plan_generator(
     goal = problem.goal
     objects = problem.objects
     operators = list(domain.operators)
+    objects_by_type = _sorted_objects_by_type(frozenset(objects))
+    parameter_types = {operator: [p.type for p in operator.parameters] for operator in operators}
 
     def _dfs(state: frozenset, actions: list, visited: frozenset) -> Generator[SasPlan, None, None]:
         if goal is None or goal.evaluate({}, state):
@@ -32,8 +34,7 @@ def plan_generator(
         if len(actions) >= max_depth:
             return
         for operator in operators:
-            for sub in get_substitutions(operator.parameters, objects):
-                obj_tuple = tuple(sub[v] for v in operator.parameters)
+            for obj_tuple in _object_tuples(parameter_types[operator], objects_by_type):
                 ground_op = operator.ground(obj_tuple, state)
                 if not ground_op.preconditions:
                     continue
@@ -1,71 +1,78 @@
 import logging
+import re
 import shutil
 from pathlib import Path
-from tempfile import TemporaryDirectory
-
-import docker
-from docker.errors import DockerException
 
 from pddl_utils.planning.pddl_planner import PDDLPlanner
+from pddl_utils.planning.planner import PlanningTimeout
+from pddl_utils.utils.docker_utils import LongLivedContainer, link_or_copy
 
 logger = logging.getLogger(__name__)
 
+FD_EXEC = "/workspace/downward/fast-downward.py"
+
+# The FD driver logs the exit code of each component; 21, 23 and 24 mean the time limit was hit.
+# https://www.fast-downward.org/latest/documentation/exit-codes/
+_OUT_OF_TIME = re.compile(r"(?:translate|search) exit code: (?:21|23|24)\b")
+
+
+class DockerFastDownward(LongLivedContainer, PDDLPlanner):
+    """Fast-downward planner running inside a long-lived ``aibasel/downward`` container.
 
-class DockerFastDownward(PDDLPlanner):
+    See :class:`LongLivedContainer` for how the container is started and removed.
+    """
+
+    _IMAGE = "aibasel/downward"
+    _CONTAINER_OPTIONS = {"mem_limit": "16g", "working_dir": "/pddls"}
 
     def __init__(self, alias_flag="--alias seq-opt-lmcut"):
         super().__init__()
         logger.debug("Instantiating FD")
         if alias_flag:
             logger.debug("with %s", alias_flag)
-        self.client = docker.from_env()
         self._alias_flag = alias_flag
 
-    def _is_docker_running(self) -> bool:
-        try:
-            self.client.ping()  # Sends a request to Docker to check if it's alive
-            return True
-        except DockerException:
-            return False
-
     def _run(self, dom_file, prob_file, timeout):
-        assert self._is_docker_running()
-        # heuristics can be found at https://www.fast-downward.org/Doc/Evaluator
-
-        with TemporaryDirectory() as docker_dir:
-            docker_dir = Path(docker_dir)
-            tmp_domain_file = "domain.pddl"
-            tmp_problem_file = "problem.pddl"
-            shutil.copy(dom_file, docker_dir / tmp_domain_file)
-            shutil.copy(prob_file, docker_dir / tmp_problem_file)
-
-            cmd = self._alias_flag or " --alias lama-first "
-            cmd += f" --search-time-limit {timeout or 60} "
-            cmd += " /pddls/%s /pddls/%s" % (tmp_domain_file, tmp_problem_file)
-
-            container = self.client.containers.run(
-                image="aibasel/downward",
-                command=cmd,
-                mem_limit="16g",
-                working_dir="/pddls",
-                entrypoint="/workspace/downward/fast-downward.py",
-                volumes={docker_dir.absolute().as_posix(): {"bind": "/pddls", "mode": "rw"}},
-                detach=True,
-            )
-            # result = container.wait()
-            container.wait()
-            # success = 0 <= result["StatusCode"] <= 3  # https://www.fast-downward.org/latest/documentation/exit-codes/
-            response = container.logs().decode().strip()
+        container = self._get_container()
+        run_dir = self._make_run_dir()
+        try:
+            link_or_copy(dom_file, run_dir / "domain.pddl")
+            link_or_copy(prob_file, run_dir / "problem.pddl")
+            return self._exec_fd(container, run_dir, "domain.pddl", "problem.pddl", timeout)
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
 
-        container.remove(force=True)
+    def _run_batch(self, dom_file, prob_files, timeout):
+        """Plan all problems in one run directory, linking the domain into it only once."""
+        container = self._get_container()
+        run_dir = self._make_run_dir()
+        try:
+            link_or_copy(dom_file, run_dir / "domain.pddl")
+            results = []
+            for i, prob_file in enumerate(prob_files):
+                problem_name = f"problem_{i}.pddl"
+                link_or_copy(prob_file, run_dir / problem_name)
+                output = self._exec_fd(container, run_dir, "domain.pddl", problem_name, timeout)
+                results.append((self._plan_from_output(output), output))
+            return results
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
 
-        return response
+    def _exec_fd(self, container, run_dir: Path, domain_name: str, problem_name: str, timeout) -> str:
+        """Run FD in the container and return its output. Raises PlanningTimeout when ``timeout`` expires.
 
-        # sas_plan_file = next(docker_dir.glob("sas_plan*"), None)
-        # if success:
-        #     assert sas_plan_file is not None
-        #     sas_plan = parse_sas_plan(sas_plan_file.read_text())
-        # else:
-        #     sas_plan = None
+        The limit is enforced by the FD driver inside the container (``--overall-time-limit``
+        covers translation and search), which reports the timeout in its output.
+        """
+        # heuristics can be found at https://www.fast-downward.org/Doc/Evaluator
+        cmd = [FD_EXEC, *(self._alias_flag or "--alias lama-first").split()]
+        cmd += ["--overall-time-limit", f"{timeout or 60}s", domain_name, problem_name]
 
-        # return sas_plan, response
+        # Streaming returns once the exec finishes and skips the extra exec_inspect request a
+        # buffered exec_run makes for the exit code, which we do not use.
+        # success = 0 <= exit_code <= 3  # https://www.fast-downward.org/latest/documentation/exit-codes/
+        _, chunks = container.exec_run(cmd, workdir=f"/pddls/{run_dir.name}", stream=True)
+        output = b"".join(chunks).decode().strip()
+        if _OUT_OF_TIME.search(output):
+            raise PlanningTimeout("Planning timed out!")
+        return output
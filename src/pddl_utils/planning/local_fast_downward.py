@@ -6,10 +6,15 @@ Code copied from https://github.com/ronuchit/pddlgym_planners/blob/master/pddlgy
 
 import logging
 import os
-import sys
+import signal
 import subprocess
 import tempfile
+from pathlib import Path
+
 from pddl_utils.planning.pddl_planner import PDDLPlanner
+from pddl_utils.planning.planner import PlanningFailure, PlanningTimeout
+from pddl_utils.structs.sas_parser import parse_sas_plan
+from pddl_utils.structs.sas_structs import SasPlan
 
 
 logger = logging.getLogger(__name__)
@@ -37,23 +42,14 @@ class LocalFastDownward(PDDLPlanner):
 
     def plan_all_from_pddl(self, dom_file: str, prob_file: str, timeout: int) -> "list[SasPlan]":
         """Run FD and return all improving plans LAMA writes to disk (sas_plan.1, .2, ...)."""
-        from pathlib import Path
-        from pddl_utils.structs.sas_parser import parse_sas_plan
-        from pddl_utils.structs.sas_structs import SasPlan
-
-        with tempfile.TemporaryDirectory() as plan_dir:
-            plan_base = os.path.join(plan_dir, "sas_plan")
-            sas_file = tempfile.NamedTemporaryFile(delete=False).name
-            timeout_cmd = "gtimeout" if sys.platform == "darwin" else "timeout"
-            cmd_str = "{} {} {} {} --plan-file {} --sas-file {} {} {} {}".format(
-                timeout_cmd, timeout, self._exec, self._alias_flag,
-                plan_base, sas_file, dom_file, prob_file, self._final_flags,
-            )
-            subprocess.getoutput(cmd_str)
-            self._cleanup()
+        with tempfile.TemporaryDirectory(prefix="fd_") as run_dir:
+            try:
+                self._run_in_dir(dom_file, prob_file, timeout, run_dir)
+            except PlanningTimeout:
+                pass  # keep the improving plans written before the timeout
 
             plans = []
-            for plan_file in sorted(Path(plan_dir).glob("sas_plan.[0-9]*")):
+            for plan_file in _plan_files(run_dir):
                 try:
                     plan = parse_sas_plan(plan_file.read_text())
                     plan = self._fix_capitalization(plan, dom_file, prob_file)
@@ -62,20 +58,78 @@ class LocalFastDownward(PDDLPlanner):
                     pass
             return plans
 
+    def _run_plan(self, dom_file, prob_file, timeout) -> tuple[SasPlan, str]:
+        """Run FD and read the plan from the ``sas_plan`` file it writes instead of scraping stdout.
+
+        Anytime configurations write improving plans to ``sas_plan.1``, ``sas_plan.2``, ...; the
+        last one is the cheapest.
+        """
+        with tempfile.TemporaryDirectory(prefix="fd_") as run_dir:
+            output = self._run_in_dir(dom_file, prob_file, timeout, run_dir)
+            self._parse_statistics(output)
+
+            plan_files = _plan_files(run_dir)
+            if not plan_files:
+                raise PlanningFailure("Plan not found with FD! Error: {}".format(output))
+            return parse_sas_plan(plan_files[-1].read_text()), output
+
+    def _run_in_dir(self, dom_file, prob_file, timeout, run_dir: str) -> str:
+        """Run FD with ``run_dir`` as its working directory; returns the FD output.
+
+        The translator output and all plan files are written into ``run_dir``, so removing the
+        directory is all the cleanup needed and concurrent calls never share files.
+        """
+        argv = self._fd_argv(
+            os.path.abspath(dom_file),
+            os.path.abspath(prob_file),
+            "--plan-file",
+            os.path.join(run_dir, "sas_plan"),
+            "--sas-file",
+            os.path.join(run_dir, "output.sas"),
+        )
+        return self._exec_fd(argv, timeout, cwd=run_dir)
+
     def _run(self, dom_file, prob_file, timeout):
-        sas_file = tempfile.NamedTemporaryFile(delete=False).name
-        timeout_cmd = "gtimeout" if sys.platform == "darwin" else "timeout"
-        cmd_str = "{} {} {} {} --sas-file {} {} {} {}".format(
-            timeout_cmd, timeout, self._exec, self._alias_flag, sas_file, dom_file, prob_file, self._final_flags
+        with tempfile.TemporaryDirectory(prefix="fd_") as run_dir:
+            return self._run_in_dir(dom_file, prob_file, timeout, run_dir)
+
+    def _fd_argv(self, dom_file, prob_file, *driver_flags) -> list[str]:
+        """Build the fast-downward.py argument list (no shell involved)."""
+        return [
+            self._exec,
+            *(self._alias_flag or "").split(),
+            *driver_flags,
+            dom_file,
+            prob_file,
+            *(self._final_flags or "").split(),
+        ]
+
+    def _exec_fd(self, argv: list[str], timeout, cwd=None) -> str:
+        """Run FD and return its combined stdout/stderr. Raises PlanningTimeout when ``timeout`` expires.
+
+        FD runs in its own session, so that on timeout the whole process group is killed,
+        including the translator and search processes the driver spawns.
+        """
+        proc = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            start_new_session=True,
+            cwd=cwd,
         )
-        output = subprocess.getoutput(cmd_str)
+        try:
+            output, _ = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Only raised while FD is still running, so a finished run never counts as a timeout.
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.communicate()
+            raise PlanningTimeout("Planning timed out!")
         return output
 
-    def _cleanup(self):
-        """Run FD cleanup"""
-        cmd_str = "{} --cleanup".format(self._exec)
-        subprocess.getoutput(cmd_str)
-
     def _install_fd(self):
         loc = os.path.dirname(self._exec)
         # Install and compile FD.
@@ -87,3 +141,13 @@ class LocalFastDownward(PDDLPlanner):
         )
         assert res_code == 0, "Could not build Fast-Downward in {}".format(loc)
         assert os.path.exists(self._exec)
+
+
+def _plan_files(run_dir: str) -> list[Path]:
+    """Plan files FD wrote to ``run_dir``, in the order they were found."""
+
+    def _index(plan_file: Path) -> int:
+        suffix = plan_file.name[len("sas_plan.") :]
+        return int(suffix) if suffix.isdigit() else 0
+
+    return sorted(Path(run_dir).glob("sas_plan*"), key=_index)
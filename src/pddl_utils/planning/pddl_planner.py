@@ -5,59 +5,75 @@ http://www.fast-downward.org/ObtainingAndRunningFastDownward
 import re
 from pddl_utils.planning.planner import Planner, PlanningFailure
 
+# Compiled once; matched against the lower-cased FD output of every call.
+_PLAN_STEP_RE = re.compile(r"(.+) \(\d+?\)")
+_EVALUATED_RE = re.compile(r"evaluated (\d+) state")
+_PLAN_LENGTH_RE = re.compile(r"plan length: (\d+) step")
+_PLAN_COST_RE = re.compile(r"] plan cost: (\d+)")
+_SEARCH_TIME_RE = re.compile(r"] search time: (\d+\.\d+)")
+_TOTAL_TIME_RE = re.compile(r"] total time: (\d+\.\d+)")
+
 
 class PDDLPlanner(Planner):
     """pddl planner
     """
 
     def _output_to_plan(self, output: str):
+        self._parse_statistics(output)
+        if "Solution found!" not in output:
+            raise PlanningFailure("Plan not found with FD! Error: {}".format(
+                output))
+        if "Plan length: 0 step" in output:
+            return []
+        
+        fd_plan = _PLAN_STEP_RE.findall(output.lower())
+        if not fd_plan:
+            raise PlanningFailure("Plan not found with FD! Error: {}".format(
+                output))
+        # Add brackets around actions to match PDDL format
+        return [f"({action.strip()})" for action in fd_plan]
+
+    def _parse_statistics(self, output: str):
+        """Update the planning statistics from the FD output.
+
+        The values are parsed into a dict of their own and merged in one step, so that
+        concurrent calls (see ``plan_parallel``) do not interleave their updates.
+        """
         # Technically this is number of evaluated states which is always
         # 1+number of expanded states, but we report evaluated for consistency
         # with FF.
-        num_node_expansions = re.findall(r"evaluated (\d+) state", output.lower())
-        plan_length = re.findall(r"plan length: (\d+) step", output.lower())
-        plan_cost = re.findall(r"] plan cost: (\d+)", output.lower())
-        search_time = re.findall(r"] search time: (\d+\.\d+)", output.lower())
-        total_time = re.findall(r"] total time: (\d+\.\d+)", output.lower())
-        if "num_node_expansions" not in self._statistics:
-            self._statistics["num_node_expansions"] = 0
+        output = output.lower()
+        num_node_expansions = _EVALUATED_RE.findall(output)
+        plan_length = _PLAN_LENGTH_RE.findall(output)
+        plan_cost = _PLAN_COST_RE.findall(output)
+        search_time = _SEARCH_TIME_RE.findall(output)
+        total_time = _TOTAL_TIME_RE.findall(output)
+        statistics = {"num_node_expansions": 0}
         if len(num_node_expansions) == 1:
             assert int(num_node_expansions[0]) == float(num_node_expansions[0])
-            self._statistics["num_node_expansions"] += int(
-                num_node_expansions[0])
+            statistics["num_node_expansions"] = int(num_node_expansions[0])
         if len(search_time) == 1:
             try:
                 search_time_float = float(search_time[0])
-                self._statistics["search_time"] = search_time_float
+                statistics["search_time"] = search_time_float
             except:
                 raise PlanningFailure("Error on output's search time format: {}".format(search_time[0]))
         if len(search_time) == 1:
             try:
                 total_time_float = float(total_time[0])
-                self._statistics["total_time"] = total_time_float
+                statistics["total_time"] = total_time_float
             except:
                 raise PlanningFailure("Error on output's total time format: {}".format(total_time[0]))
         if len(plan_length) == 1:
             try:
                 plan_length_int = int(plan_length[0])
-                self._statistics["plan_length"] = plan_length_int
+                statistics["plan_length"] = plan_length_int
             except:
                 raise PlanningFailure("Error on output's plan length format: {}".format(plan_length[0]))
         if len(plan_cost) == 1:
             try:
                 plan_cost_int = int(plan_cost[0])
-                self._statistics["plan_cost"] = plan_cost_int
+                statistics["plan_cost"] = plan_cost_int
             except:
                 raise PlanningFailure("Error on output's plan cost format: {}".format(plan_cost[0]))
-        if "Solution found!" not in output:
-            raise PlanningFailure("Plan not found with FD! Error: {}".format(
-                output))
-        if "Plan length: 0 step" in output:
-            return []
-        
-        fd_plan = re.findall(r"(.+) \(\d+?\)", output.lower())
-        if not fd_plan:
-            raise PlanningFailure("Plan not found with FD! Error: {}".format(
-                output))
-        # Add brackets around actions to match PDDL format
-        return [f"({action.strip()})" for action in fd_plan]
+        self._merge_statistics(statistics)
@@ -5,20 +5,37 @@ Code copied from https://github.com/ronuchit/pddlgym_planners/blob/master/pddlgy
 
 import os
 import tempfile
-import time
 import abc
-from typing import Literal, Union, overload
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, Sequence, Union, overload
 
 from pddl_utils.structs.sas_parser import parse_sas_plan
 from pddl_utils.structs.sas_structs import SasPlan, SasAction
+from pddl_utils.structs.pddl_structs import PDDLDomain
 from pddl_utils.structs.pddl_structs_parser import parse_domain, parse_problem
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_domain_file(dom_file: str, mtime_ns: int, size: int) -> PDDLDomain:
+    """Parse a domain file. Keyed by the file's mtime and size so edits invalidate the cache."""
+    with open(dom_file, "r") as f:
+        return parse_domain(f.read())
+
+
+def _load_domain(dom_file: str) -> PDDLDomain:
+    """Load a domain file, reusing the parsed domain while the file is unchanged."""
+    stat = os.stat(dom_file)
+    return _parse_domain_file(os.path.abspath(dom_file), stat.st_mtime_ns, stat.st_size)
+
+
 class Planner:
     """An abstract planner."""
 
     def __init__(self):
         self._statistics = {}
+        self._statistics_lock = threading.Lock()
 
     @overload
     def plan_from_pddl(
@@ -30,6 +47,7 @@ class Planner:
         remove_files: bool = False,
         return_output: Literal[True] = True,
         fix_capitalization: bool = True,
+        domain: PDDLDomain | None = None,
     ) -> tuple[SasPlan, str]: ...
     @overload
     def plan_from_pddl(
@@ -41,34 +59,88 @@ class Planner:
         remove_files: bool = False,
         return_output: Literal[False] = False,
         fix_capitalization: bool = True,
+        domain: PDDLDomain | None = None,
     ) -> SasPlan: ...
     def plan_from_pddl(
-        self, dom_file, prob_file, horizon=float("inf"), timeout=10, remove_files=False, return_output=False, fix_capitalization=True
+        self,
+        dom_file,
+        prob_file,
+        horizon=float("inf"),
+        timeout=10,
+        remove_files=False,
+        return_output=False,
+        fix_capitalization=True,
+        domain=None,
     ) -> Union[SasPlan, tuple[SasPlan, str]]:
-        """PDDL-specific planning method."""
-        start_time = time.time()
-        output = self._run(dom_file, prob_file, timeout)
-        if remove_files:
-            os.remove(dom_file)
-            os.remove(prob_file)
-        self._cleanup()
-        if time.time() - start_time > timeout:
-            raise PlanningTimeout("Planning timed out!")
-        pddl_plan_str = self._output_to_plan(output)
-        if len(pddl_plan_str) > horizon:
-            raise PlanningFailure("PDDL planning failed due to horizon")
+        """PDDL-specific planning method.
+
+        Pass the already parsed ``domain`` of ``dom_file`` if at hand; it is then used to fix
+        the plan's capitalization instead of loading the domain file again.
+        """
+        try:
+            pddl_plan, output = self._run_plan(dom_file, prob_file, timeout)
+        finally:
+            if remove_files:
+                os.remove(dom_file)
+                os.remove(prob_file)
+        pddl_plan = self._finalize_plan(pddl_plan, dom_file, prob_file, horizon, fix_capitalization, domain)
 
-        pddl_plan = parse_sas_plan("\n".join(pddl_plan_str))
-        
-        # Map lowercase action names to correctly capitalized operator names from domain
-        if fix_capitalization:
-            pddl_plan = self._fix_capitalization(pddl_plan, dom_file, prob_file)
-        
         if return_output:
             return pddl_plan, output
         else:
             return pddl_plan
 
+    def plan_many_from_pddl(
+        self,
+        dom_file: str,
+        prob_files: Sequence[str],
+        horizon=float("inf"),
+        timeout: int = 10,
+        fix_capitalization: bool = True,
+    ) -> list[SasPlan]:
+        """Plan several problems against the same domain.
+
+        Per-call setup is amortized over the batch (see ``_run_batch``). Raises on the first
+        problem that cannot be solved, like ``plan_from_pddl``.
+        """
+        results = self._run_batch(dom_file, prob_files, timeout)
+        return [
+            self._finalize_plan(pddl_plan, dom_file, prob_file, horizon, fix_capitalization)
+            for prob_file, (pddl_plan, _) in zip(prob_files, results)
+        ]
+
+    def plan_parallel(
+        self,
+        specs: Sequence[tuple[str, str]],
+        horizon=float("inf"),
+        timeout: int = 10,
+        max_workers: int | None = None,
+        fix_capitalization: bool = True,
+    ) -> list[Union[SasPlan, Exception]]:
+        """Plan independent (domain file, problem file) pairs concurrently.
+
+        The planners run as separate processes (or containers), so a thread pool is enough
+        to keep several of them busy. The result list follows the order of ``specs``; a
+        problem that fails contributes its exception instead of a plan.
+
+        Afterwards ``get_statistics()`` holds the node expansions summed over all problems;
+        the per-plan values (times, plan length and cost) are those of the last run to finish.
+        """
+
+        def _plan(spec: tuple[str, str]) -> SasPlan:
+            dom_file, prob_file = spec
+            return self.plan_from_pddl(
+                dom_file, prob_file, horizon=horizon, timeout=timeout, fix_capitalization=fix_capitalization
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_plan, spec) for spec in specs]
+        results: list[Union[SasPlan, Exception]] = []
+        for future in futures:
+            exception = future.exception()
+            results.append(future.result() if exception is None else exception)
+        return results
+
     @overload
     def plan_from_pddl_str(
         self,
@@ -124,25 +196,58 @@ class Planner:
             os.remove(dom_file)
             os.remove(prob_file)
 
+    def _run_plan(self, dom_file, prob_file, timeout) -> tuple[SasPlan, str]:
+        """Run the planner and return the plan together with the raw planner output.
+
+        The default scrapes the plan from the output of ``_run``. Planners that write their
+        plan to disk can override this to read it from there instead.
+        """
+        output = self._run(dom_file, prob_file, timeout)
+        self._cleanup()
+        return self._plan_from_output(output), output
+
+    def _run_batch(self, dom_file, prob_files, timeout) -> list[tuple[SasPlan, str]]:
+        """Run the planner on every problem. Planners that can share setup across calls override this."""
+        return [self._run_plan(dom_file, prob_file, timeout) for prob_file in prob_files]
+
+    def _plan_from_output(self, output: str) -> SasPlan:
+        """Scrape the plan from the planner output."""
+        return parse_sas_plan(self._output_to_plan(output))
+
+    def _finalize_plan(
+        self, plan: SasPlan, dom_file, prob_file, horizon, fix_capitalization, domain: PDDLDomain | None = None
+    ) -> SasPlan:
+        if len(plan) > horizon:
+            raise PlanningFailure("PDDL planning failed due to horizon")
+
+        # Map lowercase action names to correctly capitalized operator names from domain
+        if fix_capitalization:
+            plan = self._fix_capitalization(plan, dom_file, prob_file, domain)
+        return plan
+
     @abc.abstractmethod
     def _run(self, dom_file, prob_file, timeout) -> str:
+        """Run the planner and return its output. Raises PlanningTimeout once ``timeout`` expires."""
         raise NotImplementedError("Override me!")
 
     @abc.abstractmethod
     def _output_to_plan(self, output):
         raise NotImplementedError("Override me!")
 
-    def _fix_capitalization(self, plan: SasPlan, dom_file: str, prob_file: str) -> SasPlan:
+    def _fix_capitalization(
+        self, plan: SasPlan, dom_file: str, prob_file: str, domain: PDDLDomain | None = None
+    ) -> SasPlan:
         """Fix action and object names to match the capitalization in the domain and problem files.
         
         Fast Downward outputs lowercase action and object names, but the original domain/problem
         may have capitalized operator and object names. This method reads the domain and problem
-        and maps the lowercase names to their correctly capitalized versions.
+        and maps the lowercase names to their correctly capitalized versions. Unless ``domain``
+        is given, the domain file is loaded; the parsed domain is cached, as the same domain
+        file is usually planned against many times.
         """
-        with open(dom_file, 'r') as f:
-            domain_str = f.read()
-        domain = parse_domain(domain_str)
-        
+        if domain is None:
+            domain = _load_domain(dom_file)
+
         with open(prob_file, 'r') as f:
             problem_str = f.read()
         problem = parse_problem(problem_str, domain)
@@ -164,13 +269,23 @@ class Planner:
         """Allow subclasses to run cleanup after planning"""
         pass
 
+    def _merge_statistics(self, statistics: dict):
+        """Merge the statistics of one planning call: node expansions add up, other values are replaced."""
+        with self._statistics_lock:
+            statistics = dict(statistics)
+            expansions = statistics.pop("num_node_expansions", 0)
+            self._statistics["num_node_expansions"] = self._statistics.get("num_node_expansions", 0) + expansions
+            self._statistics.update(statistics)
+
     def reset_statistics(self):
         """Reset the internal statistics dictionary."""
-        self._statistics = {}
+        with self._statistics_lock:
+            self._statistics = {}
 
     def get_statistics(self):
-        """Get the internal statistics dictionary."""
-        return self._statistics
+        """Get a copy of the internal statistics dictionary."""
+        with self._statistics_lock:
+            return dict(self._statistics)
 
 
 class PlanningFailure(Exception):
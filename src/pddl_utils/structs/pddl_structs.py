@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
 
 from pddl_utils.structs.structs import (
     AbstractState,
@@ -13,7 +13,7 @@ from pddl_utils.structs.structs import (
 )
 
 
-@dataclass(frozen=True, repr=False, eq=False)
+@dataclass(frozen=True, repr=False, eq=False, slots=True)
 class PDDLDomain:
     """A PDDL domain."""
 
@@ -21,20 +21,42 @@ class PDDLDomain:
     types: frozenset[Type]
     predicates: frozenset[NamedPredicate]
     operators: frozenset[Operator]
-
-    def __post_init__(self):
-        assert all(not p.is_negated for p in self.predicates)
+    # Lazily filled caches; slotted, so there is no ``__dict__`` for ``cached_property``.
+    _pddl_str_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+    _operators_by_name_cache: dict[str, Operator] | None = field(default=None, init=False, repr=False, compare=False)
+    _parent_types_cache: dict[Type, tuple[Type, ...]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # ``copy_with`` skips the predicate check when it reuses the already checked predicates.
+    _check_predicates: InitVar[bool] = True
+
+    def __post_init__(self, _check_predicates: bool):
+        if not _check_predicates:
+            return
+        # Cannot be enforced by NamedPredicate itself: negated predicates are valid in formulas.
+        for p in self.predicates:
+            if p.is_negated:
+                raise ValueError(f"Domain predicates must not be negated. Found: {p}")
 
     def to_string(self):
         """Create PDDL string"""
+        return self._pddl_str
+
+    @property
+    def _pddl_str(self) -> str:
+        if self._pddl_str_cache is None:
+            object.__setattr__(self, "_pddl_str_cache", self._build_pddl_str())
+        return self._pddl_str_cache
+
+    def _build_pddl_str(self) -> str:
         # Sort to make serialization deterministic — ``predicates``/``operators``
         # are frozensets whose iteration order varies across processes (Python
         # hash randomization), which breaks anything that hashes ``to_string()``.
-        predicates = "\n\t".join([lit.pddl_str() for lit in sorted(self.predicates, key=lambda p: p.name)])
-        operators = "\n".join([op.pddl_str() for op in sorted(self.operators, key=lambda o: o.name)])
+        predicates = "\n\t".join(lit.pddl_str() for lit in sorted(self.predicates, key=lambda p: p.name))
+        operators = "\n".join(op.pddl_str() for op in sorted(self.operators, key=lambda o: o.name))
         constants = ""
         requirements = ":strips :typing :universal-preconditions :negative-preconditions :disjunctive-preconditions :existential-preconditions :conditional-effects"
-        if "=" in operators:
+        # Only an equality atom renders as ``(= ...)``. The check runs once per domain, as the
+        # result of ``to_string`` is cached.
+        if "(= " in operators:
             requirements += " :equality"
 
         # Emit action-cost machinery when any operator carries a cost; the
@@ -44,35 +66,32 @@ class PDDLDomain:
             requirements += " :action-costs"
             functions = "(:functions (total-cost))"
 
-        domain_str = """
-(define (domain {})
-  (:requirements {})
-  (:types {})
-  {}
-  (:predicates
-\t{}
-  )
-  {}
-
-  {}
-)
-        """.format(
-            self.domain_name,
-            requirements,
-            self._types_pddl_str(),
-            constants,
-            predicates,
-            functions,
-            operators,
-        )
-        return domain_str
+        parts = [
+            "",
+            f"(define (domain {self.domain_name})",
+            f"  (:requirements {requirements})",
+            f"  (:types {self._types_pddl_str()})",
+            f"  {constants}",
+            "  (:predicates",
+            f"\t{predicates}",
+            "  )",
+            f"  {functions}",
+            "",
+            f"  {operators}",
+            ")",
+            "        ",
+        ]
+        return "\n".join(parts)
 
     def get_operator_by_name(self, name: str) -> Operator | None:
-        """Get an operator by its name."""
-        for op in self.operators:
-            if op.name.lower() == name.lower():
-                return op
-        return None
+        """Get an operator by its name, ignoring case. Returns None if there is none."""
+        return self._operators_by_name.get(name.lower())
+
+    @property
+    def _operators_by_name(self) -> dict[str, Operator]:
+        if self._operators_by_name_cache is None:
+            object.__setattr__(self, "_operators_by_name_cache", {op.name.lower(): op for op in self.operators})
+        return self._operators_by_name_cache
 
     def write(self, fname):
         """Write the domain PDDL string to a file."""
@@ -82,23 +101,26 @@ class PDDLDomain:
             f.write(domain_str)
 
     def parent_types(self, type: Type) -> list[Type]:
-        assert type in self.types
-        p_type = type.parent
+        """Return ``type`` followed by its ancestors, nearest first.
 
-        all_types = [type]
-        if p_type is not None:
-            p_types = self.parent_types(p_type)
-            all_types.extend(p_types)
-        return all_types
+        The chain only depends on the type, so it is walked once per type and cached.
+        """
+        assert type in self.types
+        all_types = self._parent_types_cache.get(type)
+        if all_types is None:
+            chain = []
+            cur_type: Type | None = type
+            while cur_type is not None:
+                chain.append(cur_type)
+                cur_type = cur_type.parent
+            all_types = self._parent_types_cache[type] = tuple(chain)
+        return list(all_types)
 
     def _types_pddl_str(self):
-        types_str = []
-        for type in sorted(self.types, key=lambda t: t.name):
-            if type.parent:
-                types_str.append("{} - {}".format(type.name, type.parent.name))
-            else:
-                types_str.append("{}".format(type.name))
-        return " ".join(types_str)
+        return " ".join(
+            f"{type.name} - {type.parent.name}" if type.parent else type.name
+            for type in sorted(self.types, key=lambda t: t.name)
+        )
 
     def __str__(self) -> str:
         raise RuntimeError("Do not implement to assert backward compatibility. Use to_string() instead.")
@@ -109,10 +131,11 @@ class PDDLDomain:
             types=types if types is not None else self.types,
             predicates=predicates if predicates is not None else self.predicates,
             operators=operators if operators is not None else self.operators,
+            _check_predicates=predicates is not None,
         )
 
 
-@dataclass(frozen=True, repr=False, eq=False)
+@dataclass(frozen=True, repr=False, eq=False, slots=True)
 class PDDLProblem:
     """A PDDL problem."""
 
@@ -121,12 +144,16 @@ class PDDLProblem:
     objects: frozenset[Object]
     init: AbstractState
     goal: LiftedFormula
+    _objects_by_name_cache: dict[str, Object] | None = field(default=None, init=False, repr=False, compare=False)
+    _init_str_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+    _goal_str_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+    _pddl_str_cache: dict[bool, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         assert not isinstance(self.goal, frozenset)
         if self.goal is not None:
             assert not self.goal.exposed_variables, \
-                f"Goal must not have free (unquantified) variables: {self.goal.exposed_variables}"
+                f"Goal must not have free (unquantified) variables: {set(self.goal.exposed_variables)}"
 
     @property
     def goal_list(self) -> AbstractState:
@@ -134,12 +161,12 @@ class PDDLProblem:
             return frozenset()
         elif isinstance(self.goal, LiftedAtom) and not self.goal.variables:
             # Pure ground lifted atom (all-object entities)
-            return frozenset({GroundAtom(self.goal.predicate, list(self.goal.entities))})
+            return frozenset({GroundAtom(self.goal.predicate, self.goal.entities)})
         elif isinstance(self.goal, LiteralConjunction):
             result = set()
             for lit in self.goal.literals:
                 if isinstance(lit, LiftedAtom) and not lit.variables:
-                    result.add(GroundAtom(lit.predicate, list(lit.entities)))
+                    result.add(GroundAtom(lit.predicate, lit.entities))
                 elif isinstance(lit, GroundAtom):
                     result.add(lit)
             return frozenset(result)
@@ -147,19 +174,33 @@ class PDDLProblem:
 
     @property
     def init_str(self) -> str:
-        return "\n\t".join([atom.pddl_str() for atom in sorted(self.init, key=str)])
+        if self._init_str_cache is None:
+            # Sorting the PDDL strings themselves keeps the output deterministic without
+            # rendering every atom a second time as a sort key.
+            atom_strs = [atom.pddl_str() for atom in self.init]
+            atom_strs.sort()
+            object.__setattr__(self, "_init_str_cache", "\n\t".join(atom_strs))
+        return self._init_str_cache
 
     @property
     def goal_str(self) -> str:
         assert self.goal is not None
-        return self.goal.pddl_str()
+        if self._goal_str_cache is None:
+            object.__setattr__(self, "_goal_str_cache", self.goal.pddl_str())
+        return self._goal_str_cache
 
     def get_object_by_name(self, name: str) -> Object:
         """Get an object by its name."""
-        for obj in self.objects:
-            if obj.name.lower() == name.lower():
-                return obj
-        raise ValueError(f"Object with name '{name}' not found in problem objects.")
+        obj = self._objects_by_name.get(name.lower())
+        if obj is None:
+            raise ValueError(f"Object with name '{name}' not found in problem objects.")
+        return obj
+
+    @property
+    def _objects_by_name(self) -> dict[str, Object]:
+        if self._objects_by_name_cache is None:
+            object.__setattr__(self, "_objects_by_name_cache", {obj.name.lower(): obj for obj in self.objects})
+        return self._objects_by_name_cache
 
     def to_string(self, minimize_total_cost: bool = False):
         """Create PDDL problem string.
@@ -169,6 +210,12 @@ class PDDLProblem:
         ``(:metric minimize (total-cost))`` Fast Downward needs to actually
         optimise cost (otherwise costs are ignored).
         """
+        problem_str = self._pddl_str_cache.get(minimize_total_cost)
+        if problem_str is None:
+            problem_str = self._pddl_str_cache[minimize_total_cost] = self._build_pddl_str(minimize_total_cost)
+        return problem_str
+
+    def _build_pddl_str(self, minimize_total_cost: bool) -> str:
         objects_str = self.objects_pddl_str()
         init_str = self.init_str
         metric_str = ""
@@ -198,10 +245,7 @@ class PDDLProblem:
 
     def objects_pddl_str(self):
         """Create PDDL string for objects grouped by type."""
-        objects_strs = []
-        for obs in sorted(self.objects, key=lambda o: o.name):
-            objects_strs.append(f"{obs.name} - {obs.type.name}")
-        return " ".join(objects_strs)
+        return " ".join(f"{obj.name} - {obj.type.name}" for obj in sorted(self.objects, key=lambda o: o.name))
 
     def __str__(self) -> str:
         num_goals = len(self.goal_list) if self.goal is not None else 0
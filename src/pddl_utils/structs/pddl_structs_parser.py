@@ -8,7 +8,7 @@ from pddl_utils.structs.structs import (
 from pddl_utils.structs.pddl_structs import PDDLDomain, PDDLProblem
 
 
-from pddl_utils.structs.string_utils import remove_comments, parentheses_groups
+from pddl_utils.structs.string_utils import remove_comments_cached, parentheses_groups
 from pddl_utils.structs.structs_parser import (
     parse_ground_atom,
     parse_objects,
@@ -18,10 +18,16 @@ from pddl_utils.structs.structs_parser import (
     name_rgx,
 )
 
+# Compiled once at import time (``name_rgx`` is a constant).
+_DOMAIN_RE = re.compile(rf"\(define\s+\(domain\s+({name_rgx})\)([\w\W]+)\)")
+_PROBLEM_RE = re.compile(rf"\(define\s+\(problem\s+({name_rgx})\)([\w\W]+)\)")
+_SECTION_RE = re.compile(r"\((:\w+)")
+_NUMERIC_ASSIGNMENT_RE = re.compile(r"\(\s*=\s")
+
 
 def parse_domain(domain_str: str):
-    domain_str = remove_comments(domain_str, ";")
-    domain_match = re.match(rf"\(define\s+\(domain\s+({name_rgx})\)([\w\W]+)\)", domain_str.strip())
+    domain_str = remove_comments_cached(domain_str, ";")
+    domain_match = _DOMAIN_RE.match(domain_str.strip())
     if not domain_match:
         raise ValueError("Invalid domain definition: expected (define (domain <name>) ...)")
 
@@ -30,9 +36,11 @@ def parse_domain(domain_str: str):
 
     types = set()
     predicates: set[NamedPredicate] = set()
+    # Frozen once per :predicates section, so operators share one (hashed) predicate set.
+    known_predicates: frozenset[NamedPredicate] = frozenset()
     operators: list[Operator] = []
     for next_group in parentheses_groups(domain_content):
-        section_match = re.match(r"\((:\w+)", next_group)
+        section_match = _SECTION_RE.match(next_group)
         assert section_match is not None
         section_type = section_match.group(1)
         section_content = next_group[len(section_type) + 1 : -1].strip()
@@ -49,9 +57,10 @@ def parse_domain(domain_str: str):
         elif section_type == ":predicates":
             for pred_str in parentheses_groups(section_content):
                 predicates.add(parse_predicate(pred_str))
+            known_predicates = frozenset(predicates)
         elif section_type == ":action":
             assert len(predicates) > 0
-            operators.append(parse_operator(next_group, known_predicates=frozenset(predicates)))
+            operators.append(parse_operator(next_group, known_predicates=known_predicates))
         elif section_type == ":constants":
             raise ValueError(
                 f"Syntax error: Global constants are not supported in the domain definition. Rather use variables."
@@ -62,7 +71,7 @@ def parse_domain(domain_str: str):
     return PDDLDomain(
         domain_name=domain_name,
         types=frozenset(types),
-        predicates=frozenset(predicates),
+        predicates=known_predicates,
         operators=frozenset(operators),
     )
 
@@ -84,10 +93,10 @@ def parse_problem(
         assert predicates is None, "Cannot specify both a domain and predicates"
         predicates = frozenset(domain.predicates)
 
-    problem_str = remove_comments(problem_str, ";")
+    problem_str = remove_comments_cached(problem_str, ";")
 
     # Extract the main problem content
-    problem_match = re.match(rf"\(define\s+\(problem\s+({name_rgx})\)([\w\W]+)\)", problem_str.strip())
+    problem_match = _PROBLEM_RE.match(problem_str.strip())
     if not problem_match:
         raise ValueError("Invalid problem definition: expected (define (problem <name>) ...)")
 
@@ -102,12 +111,13 @@ def parse_problem(
 
     # Determine whether to infer predicates from ground atoms.
     infer_predicates = predicates is None
-    known_predicates: set[NamedPredicate] = set(predicates) if predicates is not None else set()
+    # Rebuilt only when inference finds new predicates, so that its atoms share one predicate set.
+    known_predicates: frozenset[NamedPredicate] = frozenset(predicates) if predicates is not None else frozenset()
 
     # Parse the problem content
     for next_group in parentheses_groups(problem_content):
         # Extract the section type
-        section_match = re.match(r"\((:\w+)", next_group)
+        section_match = _SECTION_RE.match(next_group)
         assert section_match is not None
 
         section_type = section_match.group(1)
@@ -121,15 +131,15 @@ def parse_problem(
                 objects = frozenset(parse_objects(section_content))
         elif section_type == ":init":
             if section_content.strip():
-                for fact_str in parentheses_groups(section_content):
-                    # Skip numeric-fluent assignments such as
-                    # ``(= (total-cost) 0)`` — they are not ground atoms.
-                    if re.match(r"\(\s*=\s", fact_str):
-                        continue
+                # Skip numeric-fluent assignments such as
+                # ``(= (total-cost) 0)`` — they are not ground atoms.
+                fact_strs = [f for f in parentheses_groups(section_content) if not _NUMERIC_ASSIGNMENT_RE.match(f)]
+                for fact_str in fact_strs:
                     if infer_predicates:
-                        known_predicates |= collect_inferred_predicates(fact_str, objects)
-                    fact_atom = parse_ground_atom(fact_str, known_predicates=frozenset(known_predicates))
-                    init_facts.add(fact_atom)
+                        inferred = collect_inferred_predicates(fact_str, objects)
+                        if not inferred <= known_predicates:
+                            known_predicates |= inferred
+                    init_facts.add(parse_ground_atom(fact_str, known_predicates=known_predicates))
         elif section_type == ":goal":
             # Parse goal condition
             if section_content.strip():
@@ -137,7 +147,7 @@ def parse_problem(
                     known_predicates |= collect_inferred_predicates(section_content, objects)
                 goal = parse_lifted_formula(
                     section_content,
-                    known_predicates=frozenset(known_predicates),
+                    known_predicates=known_predicates,
                     known_objects=objects,
                 )
 
@@ -1,13 +1,23 @@
 import re
+from typing import Iterable, Union
+
 from pddl_utils.structs.sas_structs import SasAction, SasPlan
 from pddl_utils.structs.string_utils import remove_comments
 
+_SAS_ACTION_RE = re.compile(r"\(([\w\-]+)(?: +([^\)]+)|\s*)\)")
+
 
-def parse_sas_plan(sas_plan_str: str) -> SasPlan:
+def parse_sas_plan(sas_plan: Union[str, Iterable[str]]) -> SasPlan:
     """
     Parses a SAS plan string and returns a SasPlan object.
+
+    Also accepts an iterable of already comment-free action lines, e.g. as scraped from
+    planner output, which saves joining them into one string just to split it again.
     """
-    lines = remove_comments(sas_plan_str).strip().splitlines()
+    if isinstance(sas_plan, str):
+        lines = remove_comments(sas_plan).strip().splitlines()
+    else:
+        lines = sas_plan
     actions = list(map(parse_sas_action, lines))
     return SasPlan(actions=actions)
 
@@ -16,7 +26,7 @@ def parse_sas_action(sas_action_str: str) -> SasAction:
     """
     Parses a SAS action string and returns a SasAction object.
     """
-    match = re.match(r"\(([\w\-]+)(?: +([^\)]+)|\s*)\)", sas_action_str)
+    match = _SAS_ACTION_RE.match(sas_action_str)
     assert match is not None, sas_action_str
     action_name = match.group(1)
     if match.group(2) is None:
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from functools import cached_property
 
 from pddl_utils.structs.pddl_structs import PDDLDomain
-from pddl_utils.structs.structs import Object
+from pddl_utils.structs.structs import Object, Operator, Type
 
 
 @dataclass(frozen=True, repr=False, eq=False)
@@ -15,27 +15,45 @@ class SasAction:
         Validates the action against the domain.
         :returns a list of errors if the action is invalid, otherwise an empty list.
         """
+        return self._validate(
+            domain,
+            {op.name: op for op in domain.operators},
+            {obj.name: obj for obj in objects},
+            {},
+            ignore_action_names=ignore_action_names,
+        )
+
+    def _validate(
+        self,
+        domain: PDDLDomain,
+        known_operators: dict[str, Operator],
+        objects_by_name: dict[str, Object],
+        parent_types_cache: dict[Type, frozenset[Type]],
+        *,
+        ignore_action_names: bool = False,
+    ) -> list[str]:
+        """``validate`` with the lookup tables built by the caller, so a plan builds them only once."""
         for arg_name in self.args:
-            arg = next(filter(lambda o: o.name == arg_name, objects), None)
-            if arg is None:
+            if arg_name not in objects_by_name:
                 return [f"Unknown object: {arg_name}"]
 
         if not ignore_action_names:
-            known_operators = {op.name: op for op in domain.operators}
             if self.name not in known_operators:
                 return [f"Unknown action: {self.name}"]
 
-            if len(self.args) != len(known_operators[self.name].parameters):
+            action = known_operators[self.name]
+            if len(self.args) != len(action.parameters):
                 return [
-                    f"Action {self.name} expects {len(known_operators[self.name].parameters)} arguments, but got {len(self.args)}."
+                    f"Action {self.name} expects {len(action.parameters)} arguments, but got {len(self.args)}."
                 ]
 
-            action = known_operators[self.name]
             for arg_name, param in zip(self.args, action.parameters):
-                arg = next(filter(lambda o: o.name == arg_name, objects), None)
-                assert arg is not None, f"Unknown object: {arg_name}"
+                arg = objects_by_name[arg_name]
+                parent_types = parent_types_cache.get(arg.type)
+                if parent_types is None:
+                    parent_types = parent_types_cache[arg.type] = frozenset(domain.parent_types(arg.type))
 
-                if param.type not in domain.parent_types(arg.type):
+                if param.type not in parent_types:
                     return [
                         f"Object {arg_name} of type {arg.type} is not a valid parameter for action {self.name} of type {param.type}."
                     ]
@@ -78,9 +96,14 @@ class SasPlan:
         Validates the plan against the domain.
         :return : A list of error messages if the plan is invalid, otherwise an empty list.
         """
+        known_operators = {op.name: op for op in domain.operators}
+        objects_by_name = {obj.name: obj for obj in objects}
+        parent_types_cache: dict[Type, frozenset[Type]] = {}
         errors = []
         for action in self.actions:
-            action_errors = action.validate(domain=domain, objects=objects, ignore_action_names=ignore_action_names)
+            action_errors = action._validate(
+                domain, known_operators, objects_by_name, parent_types_cache, ignore_action_names=ignore_action_names
+            )
             errors.extend(action_errors)
         return errors
 
@@ -1,13 +1,44 @@
+from functools import lru_cache
 from typing import Generator
-import re
 
 
 def remove_comments(text: str, comment_style: str = ";") -> str:
-    # Remove single-line comments
-    text = re.sub(rf"{comment_style}.*", "", text)
+    # Remove single-line comments: everything from ``comment_style`` up to the end of the line
+    if comment_style not in text:
+        return text
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        start = line.find(comment_style)
+        if start >= 0:
+            lines[i] = line[:start]
     # Remove multi-line comments
     # text = re.sub(r"\(\*[\s\S]*?\*\)", "", text)
-    return text
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def remove_comments_cached(text: str, comment_style: str = ";") -> str:
+    """``remove_comments`` for whole domain and problem files, which are often parsed repeatedly."""
+    return remove_comments(text, comment_style)
+
+
+def _closing_parenthesis_index(s: str, start: int) -> int:
+    """Index of the parenthesis closing the one opened at ``s[start]``.
+
+    Scans forward from ``start`` without slicing ``s``, so splitting a string into
+    consecutive groups stays linear in its length. The depth is tracked once per closing
+    parenthesis, counting the opening ones before it with ``str.count``.
+    """
+    i = start + 1
+    depth = 1
+    while True:
+        close = s.find(")", i)
+        if close < 0:
+            raise ValueError("No closing parenthesis found in the string `%s`" % s[start:])
+        depth += s.count("(", i, close) - 1
+        if depth == 0:
+            return close
+        i = close + 1
 
 
 def until_next_closing_parenthesis(s: str) -> tuple[str, str]:
@@ -17,22 +48,20 @@ def until_next_closing_parenthesis(s: str) -> tuple[str, str]:
     """
     if s[0] != "(":
         raise ValueError("The string must start with an opening parenthesis")
-    n_closing_parenthesis_to_skip = 0
-    for next_parenthesis in re.finditer(r"[\(\)]", s[1:]):
-        if next_parenthesis.group() == "(":
-            n_closing_parenthesis_to_skip += 1
-        elif next_parenthesis.group() == ")":
-            if n_closing_parenthesis_to_skip == 0:
-                before_closing = s[: next_parenthesis.end() + 1]
-                after_closing = s[next_parenthesis.end() + 1 :]
-                return before_closing, after_closing
-            else:
-                n_closing_parenthesis_to_skip -= 1
-    raise ValueError("No closing parenthesis found in the string `%s`" % s)
+    end = _closing_parenthesis_index(s, 0) + 1
+    return s[:end], s[end:]
 
 
 def parentheses_groups(s: str) -> Generator[str, None, None]:
     assert s[0] == "(" and s[-1] == ")", "The string must start and end with parentheses"
-    while s != "":
-        next_group, s = until_next_closing_parenthesis(s.strip())
-        yield next_group
+    i, n = 0, len(s)
+    while True:
+        while i < n and s[i].isspace():
+            i += 1
+        if i == n:
+            return
+        if s[i] != "(":
+            raise ValueError("The string must start with an opening parenthesis")
+        end = _closing_parenthesis_index(s, i) + 1
+        yield s[i:end]
+        i = end
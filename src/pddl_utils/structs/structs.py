@@ -5,11 +5,12 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field, fields
 from enum import Enum
-from functools import cached_property
-from itertools import product
+from functools import lru_cache
+from itertools import count, product
 from typing import (
     overload,
     Any,
@@ -21,6 +22,7 @@ from typing import (
     cast,
 )
 from typing_extensions import Self
+from weakref import WeakValueDictionary
 
 
 class Symbols(Enum):
@@ -75,7 +77,8 @@ class Symbols(Enum):
     TOTAL_COST = "total-cost"
 
 
-ALL_SYMBOLS: set[str] = {v.value for v in Symbols}
+# The parser checks every name against this; interned copies let interned names match by identity.
+ALL_SYMBOLS: frozenset[str] = frozenset(sys.intern(v.value) for v in Symbols)
 
 
 def is_a_keyword(word: str) -> bool:
@@ -90,29 +93,134 @@ class _PicklableCachedHash:
     string hashing per process, so a *pickled* cache would be inconsistent with an equal
     object built in another process — silently breaking ``dict``/``set`` lookups after a
     checkpoint reload. Equality is string-based and unaffected; the cache rebuilds lazily.
+    Subclasses list further process-local caches in ``_process_local_caches``.
     """
 
+    # Empty, so that subclasses declaring ``__slots__`` do not get a ``__dict__`` from here.
+    __slots__ = ()
+
+    _process_local_caches: tuple[str, ...] = ("_hash",)
+
     def __getstate__(self) -> dict:
-        return {k: v for k, v in self.__dict__.items() if k != "_hash"}
+        return {k: v for k, v in self.__dict__.items() if k not in self._process_local_caches}
 
     def __setstate__(self, state: dict) -> None:
         # Drop any stale ``_hash`` from the incoming state too, so checkpoints
         # pickled before this fix (whose stream still carries it) are repaired.
-        state.pop("_hash", None)
+        for k in self._process_local_caches:
+            state.pop(k, None)
         self.__dict__.update(state)
 
 
+class cached_property:
+    """``functools.cached_property`` without its lock.
+
+    Up to Python 3.11 the functools version serializes every first access through one lock
+    per property. The structs are immutable, so computing a value twice in a race is
+    harmless. The value is stored in the instance ``__dict__`` under the property's name,
+    from where later lookups get it without calling the descriptor.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+        self.attrname: Optional[str] = None
+        self.__doc__ = func.__doc__
+        self.__isabstractmethod__ = getattr(func, "__isabstractmethod__", False)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
+
+
+class _cached_slot:
+    """``cached_property`` for classes with ``__slots__`` (and no ``__dict__``).
+
+    The value of a property ``name`` is stored in the slot ``_<name>_cache``, which the
+    class has to declare. Like a frozen dataclass' own caches, it is written with
+    ``object.__setattr__``.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot_name = f"_{name.lstrip('_')}_cache"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return object.__getattribute__(instance, self.slot_name)
+        except AttributeError:
+            value = self.func(instance)
+            object.__setattr__(instance, self.slot_name, value)
+            return value
+
+
+# One bit per distinct type (by name and features, i.e. by ``Type.__eq__``), assigned on first
+# use, so that ``Type.is_instance`` is a single test against the mask of the type's ancestors.
+_TYPE_BITS: dict[tuple[str, tuple[str, ...]], int] = {}
+_TYPE_IDS = count()
+
+# Live types and entities by constructor arguments, so that e.g. the ``Type("block")`` and
+# ``Object("a", block)`` a parser builds for every occurrence are one shared instance each.
+# Parents and types are keyed by identity: ``Type.__eq__`` ignores the parent, which
+# ``is_instance`` does not. A key's referent stays alive as long as its instance does.
+_INSTANCES: WeakValueDictionary[tuple, Any] = WeakValueDictionary()
+
+
 @dataclass(frozen=True, order=False, repr=False)
 class Type(_PicklableCachedHash):
     """Struct defining a type."""
 
     name: str
-    feature_names: Sequence[str] = field(repr=False, default_factory=list)
+    feature_names: Sequence[str] = field(repr=False, default=())
     parent: Optional[Type] = field(default=None, repr=False)
 
+    # The type bits are only valid in the process that assigned them.
+    _process_local_caches = ("_hash", "_bit", "_ancestors_mask")
+
+    def __new__(
+        cls, name: Optional[str] = None, feature_names: Sequence[str] = (), parent: Optional[Type] = None
+    ) -> Type:
+        if name is None:
+            # Unpickling a type pickled before types were interned.
+            return object.__new__(cls)
+        key = (cls, name, tuple(feature_names), id(parent))
+        instance = _INSTANCES.get(key)
+        if instance is None:
+            instance = _INSTANCES.setdefault(key, object.__new__(cls))
+        return instance
+
+    def __init__(self, name: str, feature_names: Sequence[str] = (), parent: Optional[Type] = None) -> None:
+        # Replaces the dataclass ``__init__``: an interned type is shared by every caller and
+        # keeps the fields it was created with, its features frozen into a tuple.
+        if "name" in self.__dict__:
+            return
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "feature_names", tuple(feature_names))
+        object.__setattr__(self, "parent", parent)
+        self.__post_init__()
+
     def __post_init__(self):
         assert isinstance(self.name, str)
 
+    def __reduce__(self):
+        # Rebuild through ``__new__`` so that unpickled types are shared too.
+        return (self.__class__, (self.name, self.feature_names, self.parent))
+
+    def __setstate__(self, state: dict) -> None:
+        # Types pickled before interning carry the caller's feature list.
+        state["feature_names"] = tuple(state.get("feature_names", ()))
+        super().__setstate__(state)
+
     @property
     def dim(self) -> int:
         """Dimensionality of the feature vector of this object type."""
@@ -153,10 +261,6 @@ class Type(_PicklableCachedHash):
         # frozen=True and eq=True, so we need to override it.
         return self._hash
 
-    def __eq__(self, other: object) -> bool:
-        assert isinstance(other, Type)
-        return str(self) == str(other)
-
     def __lt__(self, other: object) -> bool:
         assert isinstance(other, Type)
         return str(self) < str(other)
@@ -164,41 +268,87 @@ class Type(_PicklableCachedHash):
     def is_instance(self, t: Type) -> bool:
         """Return whether this entity is an instance of the given type, taking
         hierarchical typing into account."""
-        cur_type: Optional[Type] = self
-        while cur_type is not None:
-            if cur_type == t:
-                return True
-            cur_type = cur_type.parent
-        return False
+        return bool(self._ancestors_mask & t._bit)
+
+    @cached_property
+    def _bit(self) -> int:
+        key = (self.name, tuple(self.feature_names))
+        bit = _TYPE_BITS.get(key)
+        if bit is None:
+            bit = _TYPE_BITS.setdefault(key, 1 << next(_TYPE_IDS))
+        return bit
+
+    @cached_property
+    def _ancestors_mask(self) -> int:
+        """Bits of this type and all its ancestors."""
+        if self.parent is None:
+            return self._bit
+        return self._bit | self.parent._ancestors_mask
 
     def __eq__(self, other: object) -> bool:
         assert isinstance(other, Type)
-        return self.name == other.name and self.feature_names == other.feature_names
+        # Types are interned (see ``__new__``), so equal types are mostly the same instance.
+        return self is other or (self.name == other.name and self.feature_names == other.feature_names)
 
     
 
 
-@dataclass(frozen=True, order=False, repr=False)
-class _TypedEntity(_PicklableCachedHash):
+class _TypedEntity:
     """Struct defining an entity with some type, either an object (e.g.,
     block3) or a variable (e.g., ?block).
 
     Should not be instantiated externally.
+
+    Entities are hashed and compared constantly while grounding, so this is a frozen
+    ``__slots__`` class that computes its string and hash once on construction (its
+    subclasses used to be dataclasses with lazily cached ``_str``/``_hash``).
     """
 
+    __slots__ = ("name", "type", "_str", "_hash", "__weakref__")
+
     name: str
     type: Type
 
+    def __new__(cls, name: Optional[str] = None, type: Optional[Type] = None) -> Self:
+        if name is None:
+            # Unpickling an entity pickled while it was still a dataclass.
+            return object.__new__(cls)
+        instance = _INSTANCES.get((cls, name, id(type)))
+        if instance is None:
+            instance = object.__new__(cls)
+            instance._init(name, type)
+            instance = _INSTANCES.setdefault((cls, name, id(type)), instance)
+        return instance
+
+    def __init__(self, name: str, type: Type) -> None:
+        # Instances are shared and set up once, in ``__new__``.
+        pass
+
+    def _init(self, name: str, type: Type) -> None:
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "type", type)
+        self.__post_init__()
+        # Names repeat across many atoms; interning lets equal entities share one string.
+        _str = sys.intern(f"{self.name}:{self.type.name}")
+        object.__setattr__(self, "_str", _str)
+        object.__setattr__(self, "_hash", hash(_str))
+
     def __post_init__(self) -> None:
         assert isinstance(self.type, Type)
 
-    @cached_property
-    def _str(self) -> str:
-        return f"{self.name}:{self.type.name}"
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
 
-    @cached_property
-    def _hash(self) -> int:
-        return hash(str(self))
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self):
+        # Re-run ``__init__`` on unpickling: the cached hash is salted per process.
+        return (self.__class__, (self.name, self.type))
+
+    def __setstate__(self, state: dict) -> None:
+        # Entities pickled while they were still dataclasses carry their ``__dict__``.
+        self._init(state["name"], state["type"])
 
     def __str__(self) -> str:
         return self._str
@@ -206,9 +356,13 @@ class _TypedEntity(_PicklableCachedHash):
     def __repr__(self) -> str:
         return self._str
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def __eq__(self, other: object) -> bool:
-        assert isinstance(other, _TypedEntity)
-        return str(self) == str(other)
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (self.name == other.name and self.type == other.type)
 
     def __lt__(self, other: object) -> bool:
         assert isinstance(other, _TypedEntity)
@@ -225,33 +379,53 @@ class _TypedEntity(_PicklableCachedHash):
         return self.type.is_instance(t)
 
 
-@dataclass(frozen=True, order=False, repr=False)
 class Object(_TypedEntity):
     """Struct defining an Object, which is just a _TypedEntity whose name does
     not start with "?"."""
 
+    __slots__ = ()
+
     def __post_init__(self) -> None:
+        super().__post_init__()
         assert not self.name.startswith("?")
         assert " " not in self.name, "Object names cannot contain spaces. Found: {}".format(self.name)
 
-    def __hash__(self) -> int:
-        # By default, the dataclass generates a new __hash__ method when
-        # frozen=True and eq=True, so we need to override it.
-        return self._hash
-
 
-@dataclass(frozen=True, order=True, repr=False)
 class Variable(_TypedEntity):
     """Struct defining a Variable, which is just a _TypedEntity whose name
-    starts with "?"."""
+    starts with "?".
+
+    Variables order by ``(name, type)``.
+    """
+
+    __slots__ = ()
 
     def __post_init__(self) -> None:
+        super().__post_init__()
         assert self.name.startswith("?")
 
-    def __hash__(self) -> int:
-        # By default, the dataclass generates a new __hash__ method when
-        # frozen=True and eq=True, so we need to override it.
-        return self._hash
+    def _sort_key(self) -> tuple[str, Type]:
+        return (self.name, self.type)
+
+    def __lt__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() < other._sort_key()
+
+    def __le__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() <= other._sort_key()
+
+    def __gt__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() > other._sort_key()
+
+    def __ge__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key() >= other._sort_key()
 
 
 @dataclass(frozen=True, order=False, repr=False)
@@ -301,9 +475,10 @@ class Predicate(_PicklableCachedHash):
         Performs type checking first.
         """
         assert len(objects) == self.arity
-        for obj, pred_type in zip(objects, self.types):
-            assert isinstance(obj, Object)
-            assert obj.is_instance(pred_type)
+        if __debug__:  # ``-O`` strips the asserts, but not the loop around them
+            for obj, pred_type in zip(objects, self.types):
+                assert isinstance(obj, Object)
+                assert obj.is_instance(pred_type)
         assert self._classifier is not None
         return self._classifier(state, objects)
 
@@ -316,13 +491,27 @@ class Predicate(_PicklableCachedHash):
     def pddl_str(self) -> str:
         """Get a string representation suitable for writing out to a PDDL
         file."""
+        return self._pddl_str
+
+    @cached_property
+    def _pddl_str(self) -> str:
         if self.arity == 0:
             return f"({self.name})"
         vars_str = " ".join(f"?x{i} - {t.name}" for i, t in enumerate(self.types))
         return f"({self.name} {vars_str})"
 
     def get_negation(self) -> Predicate:
-        """Return a negated version of this predicate."""
+        """Return a negated version of this predicate.
+
+        The negation is built once per predicate, and negating it again gives back this
+        predicate; negating atoms asks for it constantly.
+        """
+        negation = self._negation
+        negation.__dict__.setdefault("_negation", self)
+        return negation
+
+    @cached_property
+    def _negation(self) -> Predicate:
         return Predicate(
             self.name,
             self.types,
@@ -346,7 +535,11 @@ class Predicate(_PicklableCachedHash):
 
     def __lt__(self, other: object) -> bool:
         assert isinstance(other, Predicate)
-        return str(self) < str(other)
+        return self._sort_key < other._sort_key
+
+    @cached_property
+    def _sort_key(self) -> str:
+        return str(self)
 
 
 @dataclass(frozen=True, repr=False, eq=False)
@@ -355,20 +548,20 @@ class NamedPredicate(Predicate):
     types: Sequence[Type] = field(init=False)
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "types", [var.type for var in self.variables])
+        object.__setattr__(self, "types", tuple(var.type for var in self.variables))
 
     def __hash__(self) -> int:
         return super().__hash__()
 
-    def pddl_str(self) -> str:
-        """Get a string representation suitable for writing out to a PDDL
-        file."""
+    @cached_property
+    def _pddl_str(self) -> str:
         if self.arity == 0:
             return f"({self.name})"
         vars_str = " ".join(f"{var.name} - {var.type.name}" for var in self.variables)
         return f"({self.name} {vars_str})"
 
-    def get_negation(self) -> NamedPredicate:
+    @cached_property
+    def _negation(self) -> NamedPredicate:
         return NamedPredicate(
             name=self.name,
             variables=self.variables,
@@ -383,8 +576,13 @@ class _Atom(_PicklableCachedHash):
     objects).
 
     Should not be instantiated externally.
+
+    Planning creates atoms by the million, so atoms are slotted: the hash is computed on
+    construction and the remaining caches are ``_cached_slot`` properties.
     """
 
+    __slots__ = ("predicate", "entities", "_hash", "_str_cache", "_sort_key_cache", "_pddl_str_cache")
+
     predicate: Predicate
     entities: Sequence[_TypedEntity]
 
@@ -393,6 +591,9 @@ class _Atom(_PicklableCachedHash):
             raise ValueError(
                 "Atoms expect a sequence of entities, not a " "single entity."
             )
+        # Stored as a tuple, which ``GroundAtom.objects`` hands out as is.
+        if type(self.entities) is not tuple:
+            object.__setattr__(self, "entities", tuple(self.entities))
         if len(self.entities) != self.predicate.arity:
             raise ValueError(
                 f"Syntax error: Predicate {self.predicate.name} must have {self.predicate.arity} arguments. Found: {len(self.entities)}"
@@ -402,15 +603,22 @@ class _Atom(_PicklableCachedHash):
                 raise ValueError(
                     f"Syntax error: Predicate {self.predicate.name} must have argument {pred_type.name} of type {pred_type}. Found: {ent.type}"
                 )
+        # Combine the cached component hashes instead of rendering and hashing ``_str``;
+        # atoms that are equal (see ``__eq__``) have equal predicate and entity strings.
+        object.__setattr__(self, "_hash", hash((self.predicate._hash, *(ent._hash for ent in self.entities))))
+
+    def __reduce__(self):
+        # Re-run ``__init__`` on unpickling: the hash is salted per process.
+        return (self.__class__, (self.predicate, self.entities))
+
+    def __setstate__(self, state: dict) -> None:
+        # Atoms pickled before they were slotted carry their ``__dict__``.
+        self.__init__(state["predicate"], state["entities"])
 
     @property
     def _str(self) -> str:
         raise NotImplementedError("Override me")
 
-    @cached_property
-    def _hash(self) -> int:
-        return hash(str(self))
-
     def __str__(self) -> str:
         return self._str
 
@@ -420,6 +628,10 @@ class _Atom(_PicklableCachedHash):
     def pddl_str(self) -> str:
         """Get a string representation suitable for writing out to a PDDL
         file."""
+        return self._pddl_str
+
+    @_cached_slot
+    def _pddl_str(self) -> str:
         if not self.entities:
             pddl_str = f"({self.predicate.name})"
         else:
@@ -437,11 +649,30 @@ class _Atom(_PicklableCachedHash):
         return self._hash
 
     def __eq__(self, other: object) -> bool:
-        return str(self) == str(other)
+        if not isinstance(other, _Atom):
+            return str(self) == str(other)
+        # Same result as comparing the rendered strings, component by component. Predicates
+        # are shared and entities interned, so equal atoms usually hold the very same ones and
+        # the identity checks (done in C for the entity tuples) settle it.
+        return self is other or (
+            self._hash == other._hash
+            and (self.predicate is other.predicate or self.predicate == other.predicate)
+            and len(self.entities) == len(other.entities)
+            and (
+                self.entities == other.entities
+                or all(ent._str == other_ent._str for ent, other_ent in zip(self.entities, other.entities))
+            )
+        )
 
     def __lt__(self, other: object) -> bool:
         assert isinstance(other, _Atom)
-        return str(self) < str(other)
+        return self._sort_key < other._sort_key
+
+    @_cached_slot
+    def _sort_key(self) -> tuple[str, tuple[str, ...]]:
+        # Orders like ``str(self)`` (for names made of the usual PDDL characters), but
+        # compares the cached component strings instead of rendering the whole atom.
+        return (self.predicate._sort_key, tuple(ent._str for ent in self.entities))
 
 
 class LiftedFormulaBase(ABC):
@@ -452,14 +683,20 @@ class LiftedFormulaBase(ABC):
 
     @property
     @abstractmethod
-    def used_predicates(self) -> set[Predicate]:
-        """Return the set of predicates used in this formula."""
+    def used_predicates(self) -> frozenset[Predicate]:
+        """Return the set of predicates used in this formula.
+
+        Cached and shared with the enclosing formulas, hence immutable.
+        """
         ...
 
     @property
     @abstractmethod
-    def exposed_variables(self) -> set[Variable]:
-        """Return the set of variables exposed (not quantified) in this formula."""
+    def exposed_variables(self) -> frozenset[Variable]:
+        """Return the set of variables exposed (not quantified) in this formula.
+
+        Cached and shared with the enclosing formulas, hence immutable.
+        """
         ...
 
     @abstractmethod
@@ -503,9 +740,23 @@ class LiftedFormulaStrMixin(_PicklableCachedHash):
     def __repr__(self) -> str:
         return str(self)
 
+    # ``_key`` holds the fields themselves, which pickle on their own.
+    _process_local_caches = ("_hash", "_key")
+
+    @cached_property
+    def _key(self) -> tuple:
+        """The formula's fields (sequences as tuples), which identify it.
+
+        Hashing and comparing these instead of ``str(self)`` does not render the formula.
+        """
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(self, f.name) for f in fields(cast(Any, self)))
+        )
+
     @cached_property
     def _hash(self) -> int:
-        return hash(str(self))
+        return hash((self.__class__, self._key))
 
     def __hash__(self) -> int:
         return self._hash
@@ -513,27 +764,29 @@ class LiftedFormulaStrMixin(_PicklableCachedHash):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return str(self) == str(other)
+        return self is other or (self._hash == other._hash and self._key == other._key)
 
 
 @dataclass(frozen=True, repr=False, eq=False)
 class LiftedAtom(_Atom):
     """Struct defining a lifted atom (a predicate applied to variables)."""
 
-    @cached_property
+    __slots__ = ("_variables_cache", "_used_predicates_cache", "_exposed_variables_cache", "_only_variables_cache")
+
+    @_cached_slot
     def variables(self) -> list[Variable]:
         """Variable arguments for this lifted atom (excludes object constants)."""
         return [cast(Variable, ent) for ent in self.entities if isinstance(ent, Variable)]
 
-    @cached_property
-    def used_predicates(self) -> set[Predicate]:
-        return {self.predicate}
+    @_cached_slot
+    def used_predicates(self) -> frozenset[Predicate]:
+        return frozenset((self.predicate,))
 
-    @cached_property
-    def exposed_variables(self) -> set[Variable]:
-        return set(self.variables)
+    @_cached_slot
+    def exposed_variables(self) -> frozenset[Variable]:
+        return frozenset(self.variables)
 
-    @cached_property
+    @_cached_slot
     def _str(self) -> str:
         return str(self.predicate) + "(" + ", ".join(map(str, self.entities)) + ")"
 
@@ -542,33 +795,45 @@ class LiftedAtom(_Atom):
     ) -> frozenset[GroundAtom]:
         """Create a GroundAtom with a given substitution. Object constants pass through."""
         assert set(self.variables).issubset(set(sub.keys()))
-        entities = [sub[ent] if isinstance(ent, Variable) else cast(Object, ent) for ent in self.entities]
-        return frozenset({GroundAtom(self.predicate, entities)})
+        return frozenset({GroundAtom(self.predicate, self._substituted_entities(sub))})
 
     def substitute(self, sub: VarToVarSub) -> LiftedAtom:
         """Create a LiftedAtom with a given substitution. Object constants pass through."""
         assert set(self.variables).issubset(set(sub.keys()))
-        entities = [sub[ent] if isinstance(ent, Variable) else ent for ent in self.entities]
-        return LiftedAtom(self.predicate, entities)
+        return LiftedAtom(self.predicate, self._substituted_entities(sub))
 
     def evaluate(self, sub: VarToObjSub, state: frozenset[GroundAtom]) -> bool:
         """Evaluate whether this lifted atom holds given a substitution and state."""
-        return self.ground(sub, state).issubset(state)
+        # A single membership test; no one-element frozenset as ``ground`` builds it.
+        return GroundAtom(self.predicate, self._substituted_entities(sub)) in state
+
+    @_cached_slot
+    def _only_variables(self) -> bool:
+        return len(self.variables) == len(self.entities)
+
+    def _substituted_entities(self, sub: dict[Variable, Any]) -> tuple[Any, ...]:
+        """The entities with variables replaced by ``sub``; object constants pass through."""
+        if self._only_variables:
+            # Without constants, every entity is a key of ``sub``: map in one C-level pass.
+            return tuple(map(sub.__getitem__, self.entities))
+        return tuple(sub[ent] if isinstance(ent, Variable) else ent for ent in self.entities)
 
 
 @dataclass(frozen=True, repr=False, eq=False)
 class GroundAtom(_Atom):
     """Struct defining a ground atom (a predicate applied to objects)."""
 
-    @cached_property
-    def objects(self) -> list[Object]:
+    __slots__ = ()
+
+    @property
+    def objects(self) -> tuple[Object, ...]:
         """Arguments for this ground atom.
 
-        A list of "Object"s.
+        A tuple of "Object"s.
         """
-        return list(cast(Object, ent) for ent in self.entities)
+        return cast(tuple[Object, ...], self.entities)
 
-    @cached_property
+    @_cached_slot
     def _str(self) -> str:
         return str(self.predicate) + "(" + ", ".join(map(str, self.objects)) + ")"
 
@@ -588,23 +853,39 @@ class GroundAtom(_Atom):
 
 
 
+def _flatten_literals(formula: LiteralConjunction | LiteralDisjunction) -> None:
+    """Splice nested formulas of the same kind into ``formula`` and drop repeated literals.
+
+    ``AND(a, AND(b, a))`` becomes ``AND(a, b)``, so evaluation walks one flat level.
+    """
+    literals = formula.literals
+    if any(type(lit) is type(formula) for lit in literals) or len(set(literals)) != len(literals):
+        flat: list[LiftedFormula] = []
+        for lit in literals:
+            if type(lit) is type(formula):
+                flat.extend(cast(Union[LiteralConjunction, LiteralDisjunction], lit).literals)
+            else:
+                flat.append(lit)
+        object.__setattr__(formula, "literals", list(dict.fromkeys(flat)))
+
+
 @dataclass(frozen=True, repr=False, eq=False)
 class LiteralConjunction(LiftedFormulaStrMixin):
     """A logical conjunction (AND) of Literals."""
 
     literals: Sequence[LiftedFormula]
 
+    def __post_init__(self) -> None:
+        _flatten_literals(self)
+
     @cached_property
-    def used_predicates(self) -> set[Predicate]:
-        return {p for lit in self.literals for p in lit.used_predicates}
+    def used_predicates(self) -> frozenset[Predicate]:
+        return frozenset().union(*(lit.used_predicates for lit in self.literals))
 
     @cached_property
-    def exposed_variables(self) -> set[Variable]:
+    def exposed_variables(self) -> frozenset[Variable]:
         """Get all variables from the literals."""
-        variables = set()
-        for lit in self.literals:
-            variables.update(v for v in lit.exposed_variables)
-        return variables
+        return frozenset().union(*(lit.exposed_variables for lit in self.literals))
 
     def pddl_str(self) -> str:
         """Get a string representation suitable for writing out to a PDDL file."""
@@ -627,11 +908,29 @@ class LiteralConjunction(LiftedFormulaStrMixin):
     def evaluate(self, sub: VarToObjSub, state: frozenset[GroundAtom]) -> bool:
         """Evaluate whether all literals in the conjunction hold."""
         assert set(self.exposed_variables).issubset(set(sub.keys()))
-        for lit in self.literals:
+        for lit in self._eval_order:
             if not lit.evaluate(sub, state):
                 return False
         return True
 
+    @cached_property
+    def _eval_order(self) -> tuple[LiftedFormula, ...]:
+        """The literals, cheapest checks first, so that a failing conjunction fails early.
+
+        Equalities cost a dict lookup, atoms a set lookup (fewer variables first) and
+        quantifiers or other compound formulas a loop over objects. ``literals`` keeps the
+        original order for printing and grounding.
+        """
+
+        def _cost(lit: LiftedFormula) -> tuple[int, int]:
+            if isinstance(lit, EqualTo):
+                return (0, 0)
+            if isinstance(lit, _Atom):
+                return (1, len(lit.entities))
+            return (2, 0)
+
+        return tuple(sorted(self.literals, key=_cost))
+
     @cached_property
     def _str(self) -> str:
         return f"AND({', '.join(str(lit) for lit in self.literals)})"
@@ -643,17 +942,17 @@ class LiteralDisjunction(LiftedFormulaStrMixin):
 
     literals: Sequence[LiftedFormula]
 
+    def __post_init__(self) -> None:
+        _flatten_literals(self)
+
     @cached_property
-    def used_predicates(self) -> set[Predicate]:
-        return {p for lit in self.literals for p in lit.used_predicates}
+    def used_predicates(self) -> frozenset[Predicate]:
+        return frozenset().union(*(lit.used_predicates for lit in self.literals))
 
     @cached_property
-    def exposed_variables(self) -> set[Variable]:
+    def exposed_variables(self) -> frozenset[Variable]:
         """Get all variables from the literals."""
-        variables = set()
-        for lit in self.literals:
-            variables.update(v for v in lit.exposed_variables)
-        return variables
+        return frozenset().union(*(lit.exposed_variables for lit in self.literals))
 
     def pddl_str(self) -> str:
         """Get a string representation suitable for writing out to a PDDL file."""
@@ -679,6 +978,55 @@ class LiteralDisjunction(LiftedFormulaStrMixin):
         return f"OR({', '.join(str(lit) for lit in self.literals)})"
 
 
+@lru_cache(maxsize=128)
+def _objects_by_type_in_state(state: frozenset[GroundAtom]) -> dict[Type, tuple[Object, ...]]:
+    from pddl_utils.utils.structs_functs import (
+        get_objects_in_state,
+        get_objects_by_type,
+    )
+
+    objs_by_type = get_objects_by_type(get_objects_in_state(state))
+    return {t: tuple(objs) for t, objs in objs_by_type.items()}
+
+
+def _objects_for_variables(
+    state: frozenset[GroundAtom], variables: Sequence[Variable]
+) -> list[tuple[Object, ...]]:
+    """The objects in ``state`` of each variable's type, as quantifiers range over them.
+
+    Nested quantifiers and repeated evaluations see the same state over and over, so the
+    per-type index of a state is cached.
+    """
+    if isinstance(state, frozenset):
+        objs_by_type = _objects_by_type_in_state(state)
+    else:
+        objs_by_type = _objects_by_type_in_state.__wrapped__(state)
+    return [objs_by_type.get(var.type, ()) for var in variables]
+
+
+@lru_cache(maxsize=100_000)
+def _cached_quantifier_call(
+    formula: ForAll | Exists, method: str, sub_key: frozenset[tuple[Variable, Object]], state: frozenset[GroundAtom]
+):
+    return getattr(formula, method)(dict(sub_key), state)
+
+
+def _quantifier_call(formula: ForAll | Exists, method: str, sub: VarToObjSub, state: frozenset[GroundAtom]):
+    """Call ``formula.<method>(sub, state)``, memoized per formula, state and bound free variables.
+
+    Quantifiers are re-evaluated for the same states over and over during search. Their result
+    only depends on the objects bound to their exposed variables, so ``sub`` is restricted to
+    those for the cache key. States that are not frozensets are not hashable and skip the cache.
+
+    The method receives a private copy of the substitution, which it rebinds the quantified
+    variables in instead of copying it again; nested quantifiers get their own copy this way.
+    """
+    if not isinstance(state, frozenset):
+        return getattr(formula, method)(dict(sub), state)
+    sub_key = frozenset((v, sub[v]) for v in formula.exposed_variables)
+    return _cached_quantifier_call(formula, method, sub_key, state)
+
+
 @dataclass(frozen=True, repr=False, eq=False)
 class ForAll(LiftedFormulaStrMixin):
     """Represents a universal quantification (ForAll) over the given variables in the given body."""
@@ -688,12 +1036,12 @@ class ForAll(LiftedFormulaStrMixin):
     is_negative: bool = False
 
     @cached_property
-    def used_predicates(self) -> set[Predicate]:
+    def used_predicates(self) -> frozenset[Predicate]:
         return self.body.used_predicates
 
     @cached_property
-    def exposed_variables(self) -> set[Variable]:
-        return self.body.exposed_variables - set(self.variables)
+    def exposed_variables(self) -> frozenset[Variable]:
+        return self.body.exposed_variables.difference(self.variables)
 
     @cached_property
     def positive(self) -> ForAll:
@@ -703,25 +1051,18 @@ class ForAll(LiftedFormulaStrMixin):
     def ground(
         self, sub: VarToObjSub, state: frozenset[GroundAtom]
     ) -> frozenset[GroundAtom]:
-        from pddl_utils.utils.structs_functs import (
-            get_objects_in_state,
-            get_objects_by_type,
-        )
-
-        objects = get_objects_in_state(state)
-        objs_by_type = get_objects_by_type(objects)
+        return _quantifier_call(self, "_ground", sub, state)
 
-        # Get objects for each variable type
-        objs_for_vars = []
-        for var in self.variables:
-            objs_w_type = objs_by_type.get(var.type, set())
-            objs_for_vars.append(list(objs_w_type))
+    def _ground(
+        self, var_sub: dict[Variable, Object], state: frozenset[GroundAtom]
+    ) -> frozenset[GroundAtom]:
+        objs_for_vars = _objects_for_variables(state, self.variables)
 
-        # Generate all combinations using product
+        # Generate all combinations using product; the quantified variables are rebound in
+        # ``var_sub`` for each combination.
         all_grounded = set()
         for obj_combo in product(*objs_for_vars):
-            var_sub = dict(sub)
-            var_sub.update(dict(zip(self.variables, obj_combo)))
+            var_sub.update(zip(self.variables, obj_combo))
             grounded_body = self.body.ground(var_sub, state)
             all_grounded.update(grounded_body)
 
@@ -729,24 +1070,14 @@ class ForAll(LiftedFormulaStrMixin):
 
     def evaluate(self, sub: VarToObjSub, state: frozenset[GroundAtom]) -> bool:
         """Evaluate whether the forall quantification holds."""
-        from pddl_utils.utils.structs_functs import (
-            get_objects_in_state,
-            get_objects_by_type,
-        )
-
-        objects = get_objects_in_state(state)
-        objs_by_type = get_objects_by_type(objects)
+        return _quantifier_call(self, "_evaluate", sub, state)
 
-        # Get objects for each variable type
-        objs_for_vars = []
-        for var in self.variables:
-            objs_w_type = objs_by_type.get(var.type, set())
-            objs_for_vars.append(list(objs_w_type))
+    def _evaluate(self, var_sub: dict[Variable, Object], state: frozenset[GroundAtom]) -> bool:
+        objs_for_vars = _objects_for_variables(state, self.variables)
 
         # Body must hold for all combinations
         for obj_combo in product(*objs_for_vars):
-            var_sub = dict(sub)
-            var_sub.update(dict(zip(self.variables, obj_combo)))
+            var_sub.update(zip(self.variables, obj_combo))
             if not self.body.evaluate(var_sub, state):
                 return True if self.is_negative else False
 
@@ -779,12 +1110,12 @@ class Exists(LiftedFormulaStrMixin):
     is_negative: bool = False
 
     @cached_property
-    def used_predicates(self) -> set[Predicate]:
+    def used_predicates(self) -> frozenset[Predicate]:
         return self.body.used_predicates
 
     @cached_property
-    def exposed_variables(self) -> set[Variable]:
-        return self.body.exposed_variables - set(self.variables)
+    def exposed_variables(self) -> frozenset[Variable]:
+        return self.body.exposed_variables.difference(self.variables)
 
     @cached_property
     def positive(self) -> Exists:
@@ -807,30 +1138,61 @@ class Exists(LiftedFormulaStrMixin):
 
     def evaluate(self, sub: VarToObjSub, state: frozenset[GroundAtom]) -> bool:
         """Evaluate whether the existential quantification holds."""
-        from pddl_utils.utils.structs_functs import (
-            get_objects_in_state,
-            get_objects_by_type,
-        )
+        return _quantifier_call(self, "_evaluate", sub, state)
 
-        objects = get_objects_in_state(state)
-        objs_by_type = get_objects_by_type(objects)
+    def _evaluate(self, var_sub: dict[Variable, Object], state: frozenset[GroundAtom]) -> bool:
+        objs_for_vars = _objects_for_variables(state, self.variables)
 
-        # Get objects for each variable type
-        objs_for_vars = []
-        for var in self.variables:
-            objs_w_type = objs_by_type.get(var.type, set())
-            objs_for_vars.append(list(objs_w_type))
+        literals_by_depth = self._literals_by_depth
+        if literals_by_depth is not None:
+            holds = self._bind(0, var_sub, objs_for_vars, literals_by_depth, state)
+            return holds != self.is_negative
 
         # Check if body holds for any combination
         for obj_combo in product(*objs_for_vars):
-            var_sub = dict(sub)
-            var_sub.update(dict(zip(self.variables, obj_combo)))
+            var_sub.update(zip(self.variables, obj_combo))
             if self.body.evaluate(var_sub, state):
                 return False if self.is_negative else True
 
         # Body doesn't hold for any combination
         return True if self.is_negative else False
 
+    @cached_property
+    def _literals_by_depth(self) -> tuple[tuple[LiftedFormula, ...], ...] | None:
+        """For a conjunctive body, its literals grouped by how many variables must be bound to check them.
+
+        Entry ``i`` holds the literals whose quantified variables are all among the first ``i``,
+        so a partial binding can be rejected before the remaining variables are enumerated.
+        """
+        if not isinstance(self.body, LiteralConjunction):
+            return None
+        depth_of = {var: i + 1 for i, var in enumerate(self.variables)}
+        by_depth: list[list[LiftedFormula]] = [[] for _ in range(len(self.variables) + 1)]
+        for lit in self.body._eval_order:
+            by_depth[max((depth_of.get(v, 0) for v in lit.exposed_variables), default=0)].append(lit)
+        return tuple(tuple(lits) for lits in by_depth)
+
+    def _bind(
+        self,
+        var_idx: int,
+        partial_sub: dict[Variable, Object],
+        objs_for_vars: list[tuple[Object, ...]],
+        literals_by_depth: tuple[tuple[LiftedFormula, ...], ...],
+        state: frozenset[GroundAtom],
+    ) -> bool:
+        """Whether the first ``var_idx`` bindings in ``partial_sub`` extend to a satisfying one."""
+        for lit in literals_by_depth[var_idx]:
+            if not lit.evaluate(partial_sub, state):
+                return False
+        if var_idx == len(self.variables):
+            return True
+        var = self.variables[var_idx]
+        for obj in objs_for_vars[var_idx]:
+            partial_sub[var] = obj
+            if self._bind(var_idx + 1, partial_sub, objs_for_vars, literals_by_depth, state):
+                return True
+        return False
+
     @cached_property
     def _str(self) -> str:
         exists_str = f"EXISTS({[v.name for v in self.variables]}) : {self.body}"
@@ -847,11 +1209,11 @@ class When(LiftedFormulaStrMixin):
     effect: LiftedFormula
 
     @cached_property
-    def used_predicates(self) -> set[Predicate]:
+    def used_predicates(self) -> frozenset[Predicate]:
         return self.condition.used_predicates | self.effect.used_predicates
 
     @cached_property
-    def exposed_variables(self) -> set[Variable]:
+    def exposed_variables(self) -> frozenset[Variable]:
         return self.condition.exposed_variables | self.effect.exposed_variables
 
     def pddl_str(self) -> str:
@@ -887,11 +1249,11 @@ class Imply(LiftedFormulaStrMixin):
     consequent: LiftedFormula
 
     @cached_property
-    def used_predicates(self) -> set[Predicate]:
+    def used_predicates(self) -> frozenset[Predicate]:
         return self.antecedent.used_predicates | self.consequent.used_predicates
 
     @cached_property
-    def exposed_variables(self) -> set[Variable]:
+    def exposed_variables(self) -> frozenset[Variable]:
         return self.antecedent.exposed_variables | self.consequent.exposed_variables
 
     def pddl_str(self) -> str:
@@ -937,13 +1299,13 @@ class EqualTo(LiftedFormulaStrMixin):
             )
 
     @cached_property
-    def used_predicates(self) -> set[Predicate]:
-        return set()
+    def used_predicates(self) -> frozenset[Predicate]:
+        return frozenset()
 
     @cached_property
-    def exposed_variables(self) -> set[Variable]:
+    def exposed_variables(self) -> frozenset[Variable]:
         """Get all variables from the entities."""
-        return {self.left, self.right}
+        return frozenset((self.left, self.right))
 
     def pddl_str(self) -> str:
         """Get a string representation suitable for writing out to a PDDL file."""
@@ -975,13 +1337,67 @@ class EqualTo(LiftedFormulaStrMixin):
         return eq_str
 
 
-@dataclass(frozen=True, repr=False, eq=False)
-class Operator:
+def _indent_continuation_lines(text: str, indent: str = "        ") -> str:
+    """Indent all but the first line of ``text``.
+
+    Formulas render on a single line, which is returned as is rather than split and rejoined.
+    """
+    if "\n" not in text and "\r" not in text:
+        return text
+    return ("\n" + indent).join(text.splitlines())
+
+
+# An atom of an operator, ready to be instantiated with the objects of a grounding: its
+# predicate, the parameter positions of its entities if they are all parameters (else
+# ``None``), and per entity its (parameter position, None) or (None, object constant).
+_AtomTemplate = tuple[Predicate, Optional[tuple[int, ...]], tuple[tuple[Optional[int], Optional[Object]], ...]]
+
+
+def _atom_template(atom: LiftedAtom, position: dict[Variable, int]) -> _AtomTemplate:
+    arguments = tuple(
+        (position[ent], None) if isinstance(ent, Variable) else (None, cast(Object, ent)) for ent in atom.entities
+    )
+    # Atoms over parameters only, the common case, just pick objects by position.
+    positions = tuple(i for i, _ in arguments)
+    indices = cast(tuple[int, ...], positions) if None not in positions else None
+    return atom.predicate, indices, arguments
+
+
+def _instantiate_atom(template: _AtomTemplate, objects: tuple[Object, ...]) -> GroundAtom:
+    predicate, indices, arguments = template
+    if indices is not None:
+        return GroundAtom(predicate, tuple(map(objects.__getitem__, indices)))
+    return GroundAtom(predicate, tuple(objects[i] if i is not None else constant for i, constant in arguments))
+
+
+def _in_completed_state(atom: GroundAtom, objects: tuple[Object, ...], state: frozenset[GroundAtom]) -> bool:
+    """Whether ``atom`` is in ``state`` completed for ``objects`` (see ``Operator.ground``).
+
+    Completing a state adds the negation of every atom over ``objects`` that the state has
+    neither positive nor negated. So a negated atom over these objects holds unless its
+    positive twin is in the state, which is checked without building the completed state.
+    A state that is already completed gives the same answer.
+    """
+    if atom in state:
+        return True
+    predicate = atom.predicate
+    if not predicate.is_negated:
+        return False
+    return (
+        GroundAtom(predicate.get_negation(), atom.entities) not in state
+        and all(ent in objects for ent in atom.entities)
+    )
+
+
+@dataclass(frozen=True, repr=False, eq=False, slots=True)
+class Operator(_PicklableCachedHash):
     """Struct defining a symbolic operator (as in STRIPS).
 
     Lifted! Note here that the ignore_effects - unlike the
     add_effects and delete_effects - are universally
     quantified over all possible groundings.
+
+    Slotted like the atoms; the caches are ``_cached_slot`` properties.
     """
 
     name: str
@@ -991,21 +1407,45 @@ class Operator:
     # Optional non-negative integer action cost. When set, ``pddl_str`` emits an
     # ``(increase (total-cost) cost)`` effect; not part of identity (``_str``).
     cost: int | None = None
+    # Slots of the ``_cached_slot`` properties below, unset until first use.
+    _str_cache: str = field(init=False, repr=False, compare=False)
+    _hash_cache: int = field(init=False, repr=False, compare=False)
+    _pddl_str_cache: str = field(init=False, repr=False, compare=False)
+    _sort_key_cache: tuple[str, tuple[Variable, ...]] = field(init=False, repr=False, compare=False)
+    _complexity_cache: float = field(init=False, repr=False, compare=False)
+    _compiled_preconditions_cache: Optional[Callable[[tuple[Object, ...], frozenset[GroundAtom]], bool]] = field(
+        init=False, repr=False, compare=False
+    )
+    _compiled_effects_cache: Optional[
+        Callable[[tuple[Object, ...], frozenset[GroundAtom]], frozenset[GroundAtom]]
+    ] = field(init=False, repr=False, compare=False)
+    _used_predicates_cache: frozenset[Predicate] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        remaining_precond_vars = self.preconditions.exposed_variables - set(
+        remaining_precond_vars = set(self.preconditions.exposed_variables) - set(
             self.parameters
         )
         if len(remaining_precond_vars) > 0:
             raise ValueError(
                 f"Syntax error: Action {self.name} has undeclared variables in precondition: {remaining_precond_vars}"
             )
-        remaining_effect_vars = self.effects.exposed_variables - set(self.parameters)
+        remaining_effect_vars = set(self.effects.exposed_variables) - set(self.parameters)
         if len(remaining_effect_vars) > 0:
             raise ValueError(
                 f"Syntax error: Action {self.name} has undeclared variables in effect: {remaining_effect_vars}"
             )
 
+    def __reduce__(self):
+        # Re-run ``__init__`` on unpickling: the cached hash is salted per process, and
+        # ``_compiled_preconditions`` is a closure, which cannot be pickled.
+        return (self.__class__, (self.name, self.parameters, self.preconditions, self.effects, self.cost))
+
+    def __setstate__(self, state: dict) -> None:
+        # Operators pickled before they were slotted carry their ``__dict__``.
+        self.__init__(
+            state["name"], state["parameters"], state["preconditions"], state["effects"], state.get("cost")
+        )
+
     # @lru_cache(maxsize=None)
     def ground(
         self, objects: tuple[Object, ...], state: frozenset[GroundAtom]
@@ -1017,24 +1457,98 @@ class Operator:
         assert isinstance(objects, tuple)
         assert len(objects) == len(self.parameters)
         assert all(o.is_instance(p.type) for o, p in zip(objects, self.parameters))
+        compiled_preconditions = self._compiled_preconditions
+        compiled_effects = self._compiled_effects
+        if compiled_preconditions is not None and compiled_effects is not None:
+            # Both look atoms up as if the state were completed, so there is no need to complete it.
+            return GroundOperator(
+                self, list(objects), compiled_preconditions(objects, state), compiled_effects(objects, state)
+            )
+
         from pddl_utils.utils.structs_functs import complete_state_with_false_ground_atoms
-        state = complete_state_with_false_ground_atoms(state, frozenset(self.preconditions.used_predicates | self.effects.used_predicates), frozenset(objects))
+        state = complete_state_with_false_ground_atoms(state, self._used_predicates, frozenset(objects))
         sub = dict(zip(self.parameters, objects))
 
-        preconditions = self.preconditions.evaluate(sub, state)
+        if compiled_preconditions is not None:
+            preconditions = compiled_preconditions(objects, state)
+        else:
+            preconditions = self.preconditions.evaluate(sub, state)
         effects = self.effects.ground(sub, state) - state
         return GroundOperator(self, list(objects), preconditions, effects)
 
-    @cached_property
+    @_cached_slot
+    def _used_predicates(self) -> frozenset[Predicate]:
+        return frozenset(self.preconditions.used_predicates | self.effects.used_predicates)
+
+    @_cached_slot
+    def _compiled_preconditions(self) -> Optional[Callable[[tuple[Object, ...], frozenset[GroundAtom]], bool]]:
+        """``preconditions.evaluate`` specialized to this operator, taking the grounding's objects.
+
+        Available when the preconditions are a conjunction of atoms and (in)equalities, which
+        covers most STRIPS operators, and ``None`` otherwise. The formula tree is walked once
+        here; each check then indexes the objects by parameter position instead of looking
+        the variables up in a substitution. Atoms are looked up with
+        ``_in_completed_state``, so the state may but need not be completed.
+        """
+        literals = (
+            self.preconditions._eval_order
+            if isinstance(self.preconditions, LiteralConjunction)
+            else (self.preconditions,)
+        )
+        position = {var: i for i, var in enumerate(self.parameters)}
+        equalities: list[tuple[int, int, bool]] = []
+        atoms: list[_AtomTemplate] = []
+        for lit in literals:
+            if isinstance(lit, EqualTo):
+                equalities.append((position[lit.left], position[lit.right], lit.is_negative))
+            elif isinstance(lit, LiftedAtom):
+                atoms.append(_atom_template(lit, position))
+            else:
+                return None
+
+        def holds(objects: tuple[Object, ...], state: frozenset[GroundAtom]) -> bool:
+            for left, right, is_negative in equalities:
+                if (objects[left] == objects[right]) == is_negative:
+                    return False
+            for template in atoms:
+                if not _in_completed_state(_instantiate_atom(template, objects), objects, state):
+                    return False
+            return True
+
+        return holds
+
+    @_cached_slot
+    def _compiled_effects(
+        self,
+    ) -> Optional[Callable[[tuple[Object, ...], frozenset[GroundAtom]], frozenset[GroundAtom]]]:
+        """``effects.ground(sub, state) - state`` specialized like ``_compiled_preconditions``.
+
+        Available when the effects are a conjunction of atoms, the STRIPS case, and ``None``
+        otherwise (e.g. for conditional or universal effects).
+        """
+        literals = self.effects.literals if isinstance(self.effects, LiteralConjunction) else (self.effects,)
+        if not all(isinstance(lit, LiftedAtom) for lit in literals):
+            return None
+        position = {var: i for i, var in enumerate(self.parameters)}
+        atoms = [_atom_template(cast(LiftedAtom, lit), position) for lit in literals]
+
+        def new_effects(objects: tuple[Object, ...], state: frozenset[GroundAtom]) -> frozenset[GroundAtom]:
+            effects = (_instantiate_atom(template, objects) for template in atoms)
+            return frozenset(atom for atom in effects if not _in_completed_state(atom, objects, state))
+
+        return new_effects
+
+    @_cached_slot
     def _str(self) -> str:
         return f"""STRIPS-{self.name}:
     Parameters: {self.parameters}
     Preconditions: {self.preconditions}
     Effects: {self.effects}"""
 
-    @cached_property
+    @_cached_slot
     def _hash(self) -> int:
-        return hash(str(self))
+        # Hash the components (which cache their own hashes) rather than the rendered ``_str``.
+        return hash((self.name, tuple(self.parameters), self.preconditions, self.effects))
 
     def __str__(self) -> str:
         return self._str
@@ -1045,8 +1559,12 @@ class Operator:
     def pddl_str(self) -> str:
         """Get a string representation suitable for writing out to a PDDL
         file."""
+        return self._pddl_str
+
+    @_cached_slot
+    def _pddl_str(self) -> str:
         params_str = " ".join(f"{p.name} - {p.type.name}" for p in self.parameters)
-        preconds_str = "\n        ".join(self.preconditions.pddl_str().splitlines())
+        preconds_str = _indent_continuation_lines(self.preconditions.pddl_str())
         effect_body = self.effects.pddl_str().strip()
         if self.cost is not None:
             inc = f"(increase (total-cost) {self.cost})"
@@ -1055,7 +1573,7 @@ class Operator:
                 effect_body = effect_body[: effect_body.rfind(")")].rstrip() + " " + inc + ")"
             else:
                 effect_body = f"(and {effect_body} {inc})"
-        effects_str = "\n        ".join(effect_body.splitlines())
+        effects_str = _indent_continuation_lines(effect_body)
         return f"""(:action {self.name}
     :parameters ({params_str})
     :precondition {preconds_str}
@@ -1067,16 +1585,31 @@ class Operator:
 
     def __eq__(self, other: object) -> bool:
         assert isinstance(other, Operator)
-        return str(self) == str(other)
+        return self is other or (
+            self._hash == other._hash
+            and self.name == other.name
+            and tuple(self.parameters) == tuple(other.parameters)
+            and self.preconditions == other.preconditions
+            and self.effects == other.effects
+        )
 
     def __lt__(self, other: object) -> bool:
         assert isinstance(other, Operator)
+        if self._sort_key != other._sort_key:
+            return self._sort_key < other._sort_key
         return str(self) < str(other)
 
     def __gt__(self, other: object) -> bool:
         assert isinstance(other, Operator)
+        if self._sort_key != other._sort_key:
+            return self._sort_key > other._sort_key
         return str(self) > str(other)
 
+    @_cached_slot
+    def _sort_key(self) -> tuple[str, tuple[Variable, ...]]:
+        # Operators order by name and parameters; only ties fall back to the full ``_str``.
+        return (self.name, tuple(self.parameters))
+
     def copy_with(
         self,
         name: str | None = None,
@@ -1101,11 +1634,15 @@ class Operator:
         affects grounding. We'll use 2^arity as a measure of grounding
         effort.
         """
-        return float(2 ** len(self.parameters))
+        return self._complexity
 
+    @_cached_slot
+    def _complexity(self) -> float:
+        return float(1 << len(self.parameters))
 
-@dataclass(frozen=True, repr=False, eq=False)
-class GroundOperator:
+
+@dataclass(frozen=True, repr=False, eq=False, slots=True)
+class GroundOperator(_PicklableCachedHash):
     """A Operator + objects.
 
     Should not be instantiated externally.
@@ -1115,23 +1652,45 @@ class GroundOperator:
     objects: Sequence[Object]
     preconditions: bool
     effects: frozenset[GroundAtom]
+    # Slots of the ``_cached_slot`` properties below, unset until first use.
+    _str_cache: str = field(init=False, repr=False, compare=False)
+    _hash_cache: int = field(init=False, repr=False, compare=False)
+    _sort_key_cache: tuple[str, tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    _negated_effects_cache: frozenset[GroundAtom] = field(init=False, repr=False, compare=False)
 
-    @cached_property
+    def __reduce__(self):
+        # Re-run ``__init__`` on unpickling: the cached hash is salted per process.
+        return (self.__class__, (self.parent, self.objects, self.preconditions, self.effects))
+
+    def __setstate__(self, state: dict) -> None:
+        # Ground operators pickled before they were slotted carry their ``__dict__``.
+        self.__init__(state["parent"], state["objects"], state["preconditions"], state["effects"])
+
+    @_cached_slot
     def _str(self) -> str:
         return f"""GroundSTRIPS-{self.name}:
     Parameters: {self.objects}
     Preconditions: {self.preconditions}
     Effects: {sorted(self.effects, key=str)}"""
 
-    @cached_property
+    @_cached_slot
     def _hash(self) -> int:
-        return hash(str(self))
+        return hash((self.parent, tuple(self.objects), self.preconditions, self.effects))
 
     @property
     def name(self) -> str:
         """Name of this ground Operator."""
         return self.parent.name
 
+    @property
+    def negated_effects(self) -> frozenset[GroundAtom]:
+        """The negations of the effects, i.e. the atoms that applying the operator removes."""
+        return self._negated_effects
+
+    @_cached_slot
+    def _negated_effects(self) -> frozenset[GroundAtom]:
+        return frozenset(GroundAtom(atom.predicate.get_negation(), atom.entities) for atom in self.effects)
+
     @property
     def short_str(self) -> str:
         """Abbreviated name, not necessarily unique."""
@@ -1149,16 +1708,31 @@ class GroundOperator:
 
     def __eq__(self, other: object) -> bool:
         assert isinstance(other, GroundOperator)
-        return str(self) == str(other)
+        return self is other or (
+            self._hash == other._hash
+            and self.parent == other.parent
+            and tuple(self.objects) == tuple(other.objects)
+            and self.preconditions == other.preconditions
+            and self.effects == other.effects
+        )
 
     def __lt__(self, other: object) -> bool:
         assert isinstance(other, GroundOperator)
+        if self._sort_key != other._sort_key:
+            return self._sort_key < other._sort_key
         return str(self) < str(other)
 
     def __gt__(self, other: object) -> bool:
         assert isinstance(other, GroundOperator)
+        if self._sort_key != other._sort_key:
+            return self._sort_key > other._sort_key
         return str(self) > str(other)
 
+    @_cached_slot
+    def _sort_key(self) -> tuple[str, tuple[str, ...]]:
+        # Ground operators order by name and object names; only ties fall back to the full ``_str``.
+        return (self.name, tuple(o.name for o in self.objects))
+
 
 # Helper functions for creating negated predicates and literals
 @overload
@@ -1275,7 +1849,7 @@ def Not(
         # Create a negated predicate and apply it to the same entities
         negated_predicate = Not(x.predicate)
         if isinstance(x, LiftedAtom):
-            return LiftedAtom(negated_predicate, list(x.entities))
+            return LiftedAtom(negated_predicate, x.entities)
         else:  # GroundAtom
             return GroundAtom(negated_predicate, x.objects)
 
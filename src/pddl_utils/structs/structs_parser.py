@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Optional, Sequence, Union
 from pddl_utils.structs.structs import (
     Exists,
@@ -24,8 +25,86 @@ from pddl_utils.structs.string_utils import remove_comments, until_next_closing_
 
 name_rgx = r"[a-zA-Z0-9-_]+"
 
+_NOT_RE = re.compile(r"^\(not\s+(\([\w\W]+\))\)$")
+_ATOM_RE = re.compile(rf"\(({name_rgx}) *(?: +([\w\W]+))?\)")
+_PREDICATE_ARG_RE = re.compile(rf"\??{name_rgx}(?: \- {name_rgx})?")
+_EITHER_RE = re.compile(r"\(either\b")
+_GROUND_FORMULA_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
+_FORMULA_NAME_CHARS = _GROUND_FORMULA_NAME_CHARS | {"="}
+_EMPTY_AND_RE = re.compile(r"\(and\s*\)")
+_ACTION_RE = re.compile(rf"\(:action ({name_rgx})([\w\W]+)\)")
+_ACTION_FIELD_RE = re.compile(rf"(:{name_rgx})([\w\W]+)")
+_TOTAL_COST_INCREASE_RE = re.compile(r"\(\s*increase\s+\(\s*total-cost\s*\)\s+(\d+)\s*\)")
 
+
+def _predicates_by_name(known_predicates: frozenset[Predicate]) -> dict[str, Predicate]:
+    """Index ``known_predicates`` by name (the first one of a name wins, as a scan would find).
+
+    A domain or problem passes the same predicates for every atom it parses, so the index
+    is built once per predicate set. Do not modify the returned dict.
+    """
+    # ``frozenset`` returns a frozenset argument itself; other collections are not hashable.
+    return _index_predicates_by_name(frozenset(known_predicates))
+
+
+@lru_cache(maxsize=32)
+def _index_predicates_by_name(known_predicates: frozenset[Predicate]) -> dict[str, Predicate]:
+    by_name: dict[str, Predicate] = {}
+    for predicate in known_predicates:
+        by_name.setdefault(predicate.name, predicate)
+    return by_name
+
+
+@lru_cache(maxsize=32)
+def _objects_by_name(known_objects: frozenset[Object]) -> dict[str, Object]:
+    """Index ``known_objects`` by name, once per object set. Do not modify the returned dict."""
+    return {obj.name: obj for obj in known_objects}
+
+
+def _is_flat_group(group_str: str) -> bool:
+    """Whether ``group_str``, known to start with ``(`` and end with ``)``, has no other parentheses.
+
+    Stops at the first inner parenthesis instead of counting both kinds over the whole string.
+    """
+    return group_str.find("(", 1) < 0 and group_str.find(")", 0, -1) < 0
+
+
+def _split_formula_head(formula_str: str, name_chars: frozenset[str]) -> Optional[tuple[str, Optional[str]]]:
+    r"""Split ``({name} {content})`` into its name and content (``None`` without content).
+
+    Gives what matching ``\(([name_chars]+)(?:\s+([\w\W]+))?\)`` gives, but scans the name
+    and the whitespace after it and takes the content up to the last ``)`` directly:
+    a backtracking regex on whole formula bodies is run again at every nesting level.
+    Returns ``None`` where the regex does not match.
+    """
+    n = len(formula_str)
+    if n == 0 or formula_str[0] != "(":
+        return None
+    name_end = 1
+    while name_end < n and formula_str[name_end] in name_chars:
+        name_end += 1
+    if name_end == 1 or name_end == n:
+        return None
+    name = formula_str[1:name_end]
+    if formula_str[name_end] == ")":
+        return name, None
+    if not formula_str[name_end].isspace():
+        return None
+    content_start = name_end + 1
+    while content_start < n and formula_str[content_start].isspace():
+        content_start += 1
+    content_end = formula_str.rfind(")")
+    if content_end > content_start:
+        return name, formula_str[content_start:content_end]
+    if content_end == content_start and content_start - name_end >= 2:
+        # Only whitespace before the last ``)``: the content is its last character.
+        return name, formula_str[content_start - 1 : content_end]
+    return None
+
+
+@lru_cache(maxsize=1024)
 def parse_type(type_str: str) -> Type:
+    # Cached, as every typed variable, object and type definition names its type again.
     type_str = type_str.strip()
     if type_str == "object":
         return Type("object")  # the super-type of all types
@@ -34,29 +113,45 @@ def parse_type(type_str: str) -> Type:
     return Type(type_str)
 
 
+def _typed_name_lists(content_str: str) -> tuple[list[tuple[list[str], str]], list[str]]:
+    """Split ``name1 name2 - type1 name3 - type2 name4`` into its typed name lists.
+
+    Returns the ``(names, type)`` pairs and the trailing names without a type, in one pass
+    over the whitespace-separated tokens.
+    """
+    groups: list[tuple[list[str], str]] = []
+    pending: list[str] = []
+    tokens = content_str.split()
+    i = 0
+    while i < len(tokens):
+        if tokens[i] == "-" and i + 1 < len(tokens):
+            if not pending:
+                raise ValueError(f"Syntax error: Type without names in `{content_str.strip()}`.")
+            groups.append((pending, tokens[i + 1]))
+            pending = []
+            i += 2
+        else:
+            pending.append(tokens[i])
+            i += 1
+    return groups, pending
+
+
 def parse_types(content_str: str) -> Sequence[Type]:
     types = list()
+    groups, untyped_names = _typed_name_lists(content_str)
     # First, handle types with explicit supertypes (e.g., "type1 type2 - supertype")
-    typed_matches = re.findall(r"([^-]+)-\s*(\w+)", content_str)
-    for type_group in typed_matches:
-        type_names = type_group[0].strip().split()
-        type_super = parse_type(type_group[1].strip())
+    for type_names, type_super_str in groups:
+        type_super = parse_type(type_super_str)
         for type_name in type_names:
-            if type_name.strip():
-                types.append(Type(type_name.strip(), parent=type_super))
-
-    # Then, handle types without explicit supertypes (e.g., "block robot")
-    # Remove all typed definitions from content_str
-    remaining = content_str
-    for match in typed_matches:
-        remaining = remaining.replace(f"{match[0]}- {match[1]}", "")
-        remaining = remaining.replace(f"{match[0]}-{match[1]}", "")
-
-    # Parse remaining untyped type names (they implicitly inherit from object)
-    untyped_names = remaining.strip().split()
+            types.append(Type(type_name, parent=type_super))
+
+    # Then, handle types without explicit supertypes (e.g., "block robot"); they implicitly
+    # inherit from object
+    typed_names = {t.name for t in types}
     for type_name in untyped_names:
-        if type_name.strip() and not any(t.name == type_name.strip() for t in types):
-            types.append(Type(type_name.strip(), parent=None))
+        if type_name not in typed_names:
+            typed_names.add(type_name)
+            types.append(Type(type_name, parent=None))
 
     return types
 
@@ -78,13 +173,26 @@ def parse_variable(variables_str: str, variable_type: Optional[Type] = None) ->
 
 def parse_variable_definitions(variables_str: str) -> Sequence[Variable]:
     variables = []
-    for var_set in re.findall(rf"(?:\?.+? +)+\- +[\w\W]+?(?=(?:\?|$))", variables_str):
-        assert isinstance(var_set, str)
-        variable_str, var_type = var_set.strip().split(" - ")
-        variable_str = variable_str.strip().split()
-        for variable_str in variable_str:
-            variables.append(parse_variable(variable_str, parse_type(var_type)))
-    n_vars = len(re.findall(rf"\?{name_rgx}", variables_str))
+    # Typed variable lists, ``?a ?b - type1 ?c - type2``, in one pass over the tokens.
+    tokens = variables_str.split()
+    untyped: list[str] = []
+    i = 0
+    while i < len(tokens):
+        if tokens[i] == "-":
+            if not untyped:
+                raise ValueError(f"Syntax error: Type without variables in `{variables_str}`.")
+            if i + 1 < len(tokens):
+                var_type = parse_type(tokens[i + 1])
+                for variable_str in untyped:
+                    if not variable_str.startswith("?"):
+                        raise ValueError(f"Syntax error: {variable_str} is not a variable (must start with '?').")
+                    variables.append(parse_variable(variable_str, var_type))
+            untyped = []
+            i += 2
+        else:
+            untyped.append(tokens[i])
+            i += 1
+    n_vars = sum(1 for token in tokens if token.startswith("?"))
     if len(variables) != n_vars:
         raise ValueError(
             f"Syntax error: All defined variables must have a type. Found {n_vars} variables, but only {len(variables)} have types."
@@ -106,12 +214,11 @@ def parse_object(constant_str: str, constant_type: Optional[Type] = None) -> Obj
 
 def parse_objects(content_str: str) -> Sequence[Object]:
     objects = list()
-    for obj_group in re.findall(r"((?:\b[\w-]+\s+)+)-\s*(\w+)", content_str):
-        obj_names = obj_group[0].strip().split()
-        obj_type = parse_type(obj_group[1].strip())
+    # Objects without a type are skipped.
+    for obj_names, obj_type_str in _typed_name_lists(content_str)[0]:
+        obj_type = parse_type(obj_type_str)
         for obj_name in obj_names:
-            if obj_name.strip():
-                objects.append(Object(obj_name.strip(), obj_type))
+            objects.append(Object(obj_name, obj_type))
     return objects
 
 
@@ -129,32 +236,28 @@ def _parse_ground_atom(
     if ground_atom_str[0] != "(" or ground_atom_str[-1] != ")":
         raise ValueError("The predicate must start and end with parentheses")
 
-    not_match = re.match(r"^\(not\s+(\([\w\W]+\))\)$", ground_atom_str.strip())
-    if not_match:
-        inner = not_match.group(1)
+    # Only a group with nested parentheses can be ``(not ...)``.
+    if not _is_flat_group(ground_atom_str):
+        not_match = _NOT_RE.match(ground_atom_str)
+        assert (
+            not_match is not None
+        ), f"Invalid syntax: '{ground_atom_str}' is not a valid predicate. Maybe you forgot an operator?"
         return Not(
             _parse_ground_atom(
-                inner, known_predicates=known_predicates, allow_missing_predicates=allow_missing_predicates
+                not_match.group(1), known_predicates=known_predicates, allow_missing_predicates=allow_missing_predicates
             )
         )
 
-    assert (
-        ground_atom_str.count("(") == 1 and ground_atom_str.count(")") == 1
-    ), f"Invalid syntax: '{ground_atom_str}' is not a valid predicate. Maybe you forgot an operator?"
-
-    matches = re.match(rf"\(({name_rgx}) *(?: +([\w\W]+))?\)", ground_atom_str)
-    if matches is None:
+    # ``({pred_name} {pred_args..})`` as ``_ATOM_RE`` matches it, split without the regex: the
+    # name runs up to the first space.
+    predicate_name, _, predicate_args_str = ground_atom_str[1:-1].partition(" ")
+    if not predicate_name or not _GROUND_FORMULA_NAME_CHARS.issuperset(predicate_name):
         raise ValueError(
             "Syntax error: Invalid predicate definition %s (expecting ({pred_name} {pred_args..}))" % ground_atom_str
         )
-    predicate_name = matches.group(1)
-    predicate_args = matches.group(2)
-    if predicate_args is None:
-        predicate_args = []
-    else:
-        predicate_args = [arg.strip() for arg in predicate_args.split()]
+    predicate_args = predicate_args_str.split()
 
-    predicate = next((p for p in known_predicates if p.name == predicate_name), None)
+    predicate = _predicates_by_name(known_predicates).get(predicate_name)
     if predicate is None:
         if allow_missing_predicates:
             predicate = Predicate(predicate_name, types=[Type("object") for _ in predicate_args])
@@ -174,26 +277,29 @@ def collect_inferred_predicates(
     Does not build atoms — just ensures every predicate leaf is registered so
     that the existing parse_ground_formula / parse_ground_atom can be called afterwards.
     """
-    formula_str = remove_comments(formula_str).strip()
+    return _collect_inferred_predicates(remove_comments(formula_str), objects)
+
+
+def _collect_inferred_predicates(formula_str: str, objects: frozenset[Object]) -> frozenset[NamedPredicate]:
+    formula_str = formula_str.strip()
     if not (formula_str.startswith("(") and formula_str.endswith(")")):
         return frozenset()
 
-    matches = re.match(rf"\(([a-zA-Z0-9_\-]+)(?:\s+([\w\W]+))?\)", formula_str)
-    if matches is None:
+    head = _split_formula_head(formula_str, _GROUND_FORMULA_NAME_CHARS)
+    if head is None:
         return frozenset()
 
-    formula_name = matches.group(1)
-    formula_content = matches.group(2)
+    formula_name, formula_content = head
     inferred_predicates = set()
 
     if is_a_keyword(formula_name):
         # Recurse into compound formulas (and, not, or, forall, exists, …)
         for sub_str in parentheses_groups(formula_content.strip()) if formula_content else []:
-            inferred_predicates |= collect_inferred_predicates(sub_str, objects)
+            inferred_predicates |= _collect_inferred_predicates(sub_str, objects)
     elif formula_name not in inferred_predicates:
         arg_names = formula_content.split() if formula_content else []
         obj_list: list[Object] = []
-        objects_by_name = {obj.name: obj for obj in objects}
+        objects_by_name = _objects_by_name(frozenset(objects))
         for arg_name in arg_names:
             if arg_name not in objects_by_name:
                 raise ValueError(
@@ -209,16 +315,16 @@ def collect_inferred_predicates(
 
 def parse_predicate(predicate_str: str, *, known_predicates: Optional[frozenset[Predicate]] = None) -> NamedPredicate:
     assert predicate_str[0] == "(" and predicate_str[-1] == ")", "The predicate must start and end with parentheses"
-    if re.search(r"\(either\b", predicate_str):
+    if _EITHER_RE.search(predicate_str):
         raise ValueError(
             f"Unsupported syntax: '(either ...)' type unions are not supported in predicate definitions. Got: {predicate_str}"
         )
-    if predicate_str.count("(") != 1 or predicate_str.count(")") != 1:
+    if not _is_flat_group(predicate_str):
         raise ValueError(
             f"Invalid syntax: '{str(predicate_str)}' is not a valid predicate. Maybe you forgot an operator?"
         )
 
-    matches = re.match(rf"\(({name_rgx}) *(?: +([\w\W]+))?\)", predicate_str)
+    matches = _ATOM_RE.match(predicate_str)
     if matches is None:
         raise ValueError(
             "Syntax error: Invalid predicate definition %s (expecting ({pred_name} {pred_args..}))" % predicate_str
@@ -228,7 +334,12 @@ def parse_predicate(predicate_str: str, *, known_predicates: Optional[frozenset[
     if predicate_args is None:
         predicate_args = []
     else:
-        predicate_args = re.findall(rf"\??{name_rgx}(?: \- {name_rgx})?", predicate_args)
+        tokens = predicate_args.split()
+        if "-" not in predicate_args and predicate_args.count("?") == len(tokens) and all(t[0] == "?" for t in tokens):
+            # Untyped variables, as in every atom of an action: the tokens are the arguments.
+            predicate_args = tokens
+        else:
+            predicate_args = _PREDICATE_ARG_RE.findall(predicate_args)
         if any(arg[0] != "?" for arg in predicate_args):
             raise ValueError(
                 f"Syntax error: Predicate arguments of {predicate_name} must be variables. Found: {predicate_args}"
@@ -237,8 +348,7 @@ def parse_predicate(predicate_str: str, *, known_predicates: Optional[frozenset[
     if is_a_keyword(predicate_name):
         raise ValueError(f"Syntax error: {predicate_name} is a keyword and cannot be used as a predicate name")
 
-    known_predicates_by_name = {p.name: p for p in known_predicates} if known_predicates else {}
-    predicate = known_predicates_by_name.get(predicate_name)
+    predicate = _predicates_by_name(known_predicates).get(predicate_name) if known_predicates else None
     if predicate is None and (len(predicate_args) > 0 and "-" not in predicate_str):
         raise ValueError(f"Predicate {predicate_name} is not known in the current context.")
     existing_types = predicate.types if predicate else [None for _ in range(len(predicate_args))]
@@ -269,14 +379,14 @@ def _parse_mixed_atom(
     both the quantifier's variables and objects from the problem.
     """
     assert atom_str[0] == "(" and atom_str[-1] == ")"
-    matches = re.match(rf"\(({name_rgx}) *(?: +([\w\W]+))?\)", atom_str)
+    matches = _ATOM_RE.match(atom_str)
     if matches is None:
         raise ValueError(f"Syntax error: Invalid atom definition {atom_str}")
     predicate_name = matches.group(1)
     args_str = matches.group(2)
     arg_names = args_str.split() if args_str else []
 
-    predicate = next((p for p in known_predicates if p.name == predicate_name), None)
+    predicate = _predicates_by_name(known_predicates).get(predicate_name)
     if predicate is None:
         raise ValueError(f"Predicate {predicate_name} is not known in the current context.")
 
@@ -301,42 +411,85 @@ def parse_lifted_formula(
     variables: Optional[Sequence[Variable]] = None,
     known_objects: Optional[frozenset[Object]] = None,
     unsupported_formulas: Optional[list[str]] = None,
+) -> LiftedFormula:
+    # Comments are stripped once here; the recursion below only sees comment-free text.
+    return _parse_lifted_formula(
+        remove_comments(formula_str),
+        known_predicates=known_predicates,
+        variables=variables,
+        known_objects=known_objects,
+        unsupported_formulas=unsupported_formulas,
+        negated=False,
+    )
+
+
+def _parse_lifted_formula(
+    formula_str: str,
+    *,
+    known_predicates: Optional[frozenset[Predicate]],
+    variables: Optional[Sequence[Variable]],
+    known_objects: Optional[frozenset[Object]],
+    unsupported_formulas: Optional[Sequence[str]],
+    negated: bool,
+) -> LiftedFormula:
+    """Parse ``formula_str``, or ``(not formula_str)`` if ``negated``.
+
+    Negations are pushed inwards while parsing (as ``Not`` does on a parsed formula), so
+    that ``(not ...)`` does not build a subtree only to rebuild it negated.
+    """
+    # Formulas are immutable, so equal (sub-)formulas in the same context, e.g. preconditions
+    # shared by several actions, are parsed once and shared.
+    return _parse_lifted_formula_cached(
+        formula_str,
+        frozenset(known_predicates) if known_predicates is not None else None,
+        tuple(variables) if variables is not None else None,
+        frozenset(known_objects) if known_objects is not None else None,
+        tuple(unsupported_formulas) if unsupported_formulas is not None else None,
+        negated,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_lifted_formula_cached(
+    formula_str: str,
+    known_predicates: Optional[frozenset[Predicate]],
+    variables: Optional[tuple[Variable, ...]],
+    known_objects: Optional[frozenset[Object]],
+    unsupported_formulas: Optional[tuple[str, ...]],
+    negated: bool,
 ) -> LiftedFormula:
     assert formula_str[0] == "(" and formula_str[-1] == ")", "The formula must start and end with parentheses"
-    formula_str = remove_comments(formula_str)
 
-    if formula_str in ["()", "(and)", "(and )"] or re.fullmatch(r"\(and\s*\)", formula_str):
-        return LiteralConjunction([])
+    if formula_str in ["()", "(and)", "(and )"] or _EMPTY_AND_RE.fullmatch(formula_str):
+        return LiteralDisjunction([]) if negated else LiteralConjunction([])
 
-    matches = re.match(rf"\(([a-zA-Z0-9_\-\=]+)(?:\s+([\w\W]+))?\)", formula_str)
-    if matches is None:
+    head = _split_formula_head(formula_str, _FORMULA_NAME_CHARS)
+    if head is None:
         raise ValueError(
             "Syntax error: Invalid formula definition %s (expecting ({formula_name} {formula_args..}))" % formula_str
         )
-    formula_name = matches.group(1)
-    formula_content = matches.group(2)
+    formula_name, formula_content = head
 
     if unsupported_formulas is not None and formula_name in unsupported_formulas:
         raise ValueError(f"Syntax error: Formula `{formula_name}` is not supported in the current context")
 
+    def parse(sub_formula_str, *, negated=negated, variables=variables, unsupported_formulas=unsupported_formulas):
+        return _parse_lifted_formula(
+            sub_formula_str,
+            known_predicates=known_predicates,
+            variables=variables,
+            known_objects=known_objects,
+            unsupported_formulas=unsupported_formulas,
+            negated=negated,
+        )
+
     if is_a_keyword(formula_name):
         if formula_name == "when":
             condition_str, effect_str = parentheses_groups(formula_content.strip())
-            # The condition of a when-clause is not an effect, so unsupported_formulas don't apply there
-            condition = parse_lifted_formula(
-                condition_str,
-                known_predicates=known_predicates,
-                variables=variables,
-                known_objects=known_objects,
-                unsupported_formulas=None,
-            )
-            effect = parse_lifted_formula(
-                effect_str,
-                known_predicates=known_predicates,
-                variables=variables,
-                known_objects=known_objects,
-                unsupported_formulas=unsupported_formulas,
-            )
+            # The condition of a when-clause is not an effect, so unsupported_formulas don't apply there.
+            # NOT(WHEN(cond, eff)) = WHEN(cond, NOT(eff))
+            condition = parse(condition_str, negated=False, unsupported_formulas=None)
+            effect = parse(effect_str)
             return When(condition=condition, effect=effect)
         elif formula_name in ["exists", "forall"]:
             variables_str, conditions_str = parentheses_groups(formula_content.strip())
@@ -344,17 +497,11 @@ def parse_lifted_formula(
             # Merge with existing variables
             merged_variables = list(variables) if variables else []
             merged_variables.extend(parsed_variables)
-            conditions = parse_lifted_formula(
-                conditions_str,
-                known_predicates=known_predicates,
-                variables=merged_variables,
-                known_objects=known_objects,
-                unsupported_formulas=unsupported_formulas,
-            )
+            conditions = parse(conditions_str, negated=False, variables=merged_variables)
             if formula_name == "forall":
-                return ForAll(parsed_variables, conditions)
+                return ForAll(parsed_variables, conditions, is_negative=negated)
             elif formula_name == "exists":
-                return Exists(parsed_variables, conditions)
+                return Exists(parsed_variables, conditions, is_negative=negated)
         elif formula_name == "=":
             variables_by_name: dict[str, Variable] = {v.name: v for v in variables} if variables else {}
             terms = []
@@ -363,34 +510,36 @@ def parse_lifted_formula(
                 assert term_name in variables_by_name
                 terms.append(variables_by_name[term_name])
             assert len(terms) == 2, "Equality must have exactly two terms"
-            return EqualTo(terms[0], terms[1])
+            return EqualTo(terms[0], terms[1], is_negative=negated)
 
+        # The operands of ``not`` are negated once more; those of ``imply`` are parsed as they
+        # are and the implication is negated as a whole.
+        if formula_name == "not":
+            terms_negated = not negated
+        elif formula_name == "imply":
+            terms_negated = False
+        else:
+            terms_negated = negated
         try:
-            terms = list(
-                map(
-                    lambda t: parse_lifted_formula(
-                        t,
-                        known_predicates=known_predicates,
-                        variables=variables,
-                        known_objects=known_objects,
-                        unsupported_formulas=unsupported_formulas,
-                    ),
-                    parentheses_groups(formula_content.strip()) if formula_content is not None else [],
-                )
-            )
+            terms = [
+                parse(t, negated=terms_negated)
+                for t in (parentheses_groups(formula_content.strip()) if formula_content is not None else [])
+            ]
         except AssertionError:
             raise ValueError(f"Syntax error: {formula_content} is not a valid formula")
 
-        if formula_name == "and":
-            return LiteralConjunction(terms)
-        elif formula_name == "or":
-            return LiteralDisjunction(terms)
+        if formula_name in ["and", "or"]:
+            if not negated:
+                return LiteralConjunction(terms) if formula_name == "and" else LiteralDisjunction(terms)
+            # De Morgan's law. Like ``Not``, this keeps only the operands that are atoms.
+            negated_literals = [t for t in terms if isinstance(t, (LiftedAtom, GroundAtom))]
+            return LiteralDisjunction(negated_literals) if formula_name == "and" else LiteralConjunction(negated_literals)
         elif formula_name == "not":
             if len(terms) != 1:
                 raise ValueError(f"Syntax error: Not operator must have one argument: {formula_str}")
-            return Not(terms[0])
+            return terms[0]
         elif formula_name == "imply":
-            return Imply(*terms)
+            return Not(Imply(*terms)) if negated else Imply(*terms)
         elif formula_name in ["if", "implies"]:
             raise ValueError("invalid formula name `%s` in `%s`" % (formula_name, formula_str))
         else:
@@ -400,14 +549,16 @@ def parse_lifted_formula(
         if known_objects is not None and known_predicates is not None:
             # Mixed context (e.g. inside goal exists/forall): resolve constants from known_objects
             vars_by_name = {v.name: v for v in variables} if variables else {}
-            objs_by_name = {o.name: o for o in known_objects}
-            return _parse_mixed_atom(
+            objs_by_name = _objects_by_name(known_objects)
+            atom = _parse_mixed_atom(
                 formula_str,
                 known_predicates=known_predicates,
                 known_variables=vars_by_name,
                 known_objects=objs_by_name,
             )
-        return parse_lifted_atom(formula_str, known_predicates=known_predicates)
+        else:
+            atom = parse_lifted_atom(formula_str, known_predicates=known_predicates)
+        return LiftedAtom(atom.predicate.get_negation(), atom.entities) if negated else atom
 
 
 def parse_ground_formula(
@@ -431,7 +582,7 @@ def parse_operator(
     known_predicates: Optional[frozenset[Predicate]] = None,
 ):
     operator_str = remove_comments(operator_str)
-    matches = re.match(rf"\(:action ({name_rgx})([\w\W]+)\)", operator_str.strip())
+    matches = _ACTION_RE.match(operator_str.strip())
     if matches is None:
         if previous_action is None:
             raise ValueError(f"Syntax error: {operator_str} is not a valid action definition")
@@ -454,7 +605,7 @@ def parse_operator(
         cost = None
 
     while after_group != "":
-        matches = re.match(rf"(:{name_rgx})([\w\W]+)", after_group.strip())
+        matches = _ACTION_FIELD_RE.match(after_group.strip())
 
         if matches is None:
             raise ValueError(
@@ -484,7 +635,7 @@ def parse_operator(
             # Strip an optional action-cost effect ``(increase (total-cost) k)``
             # before parsing; ``increase`` is not a predicate. A trailing empty
             # ``(and )`` left behind is harmless.
-            cost_match = re.search(r"\(\s*increase\s+\(\s*total-cost\s*\)\s+(\d+)\s*\)", var_content)
+            cost_match = _TOTAL_COST_INCREASE_RE.search(var_content)
             if cost_match is not None:
                 cost = int(cost_match.group(1))
                 var_content = (var_content[: cost_match.start()] + var_content[cost_match.end() :]).strip()
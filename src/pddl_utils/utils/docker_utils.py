@@ -0,0 +1,95 @@
+"""Helpers shared by the docker-backed planner and validator."""
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from uuid import uuid4
+
+import docker
+from docker.errors import DockerException
+
+
+class LongLivedContainer:
+    """Mixin running a tool inside one long-lived container.
+
+    The container of ``_IMAGE`` is started on the first :meth:`_get_container` call
+    (``sleep infinity``) and the tool is executed in it via ``exec_run``, so container
+    setup is paid only once. Call :meth:`close` to stop and remove it.
+    """
+
+    _IMAGE: str
+    # Further ``containers.run`` arguments, e.g. a memory limit.
+    _CONTAINER_OPTIONS: dict = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = docker.from_env()
+        # Host directory bound to ``/pddls``; each call works in its own subdirectory
+        # so that concurrent ``exec_run``s do not overwrite each other's files.
+        self._shared_dir = Path(tempfile.mkdtemp(prefix="pddls_"))
+        atexit.register(shutil.rmtree, self._shared_dir, ignore_errors=True)
+        self._container = None
+        self._container_lock = threading.Lock()
+
+    def _is_docker_running(self) -> bool:
+        try:
+            self.client.ping()  # Sends a request to Docker to check if it's alive
+            return True
+        except DockerException:
+            return False
+
+    def _get_container(self):
+        with self._container_lock:
+            if self._container is None:
+                assert self._is_docker_running()
+                container = self.client.containers.run(
+                    image=self._IMAGE,
+                    command="infinity",
+                    entrypoint="sleep",
+                    volumes={self._shared_dir.absolute().as_posix(): {"bind": "/pddls", "mode": "rw"}},
+                    detach=True,
+                    **self._CONTAINER_OPTIONS,
+                )
+                self._container_started(container)
+                self._container = container
+            return self._container
+
+    def _container_started(self, container):
+        """Called once the container is up, before any ``exec_run``."""
+        pass
+
+    def _make_run_dir(self) -> Path:
+        run_dir = self._shared_dir / uuid4().hex
+        run_dir.mkdir()
+        return run_dir
+
+    def close(self):
+        """Stop and remove the container."""
+        if self._container is not None:
+            try:
+                self._container.remove(force=True)
+            except DockerException:
+                pass
+            self._container = None
+        shutil.rmtree(self._shared_dir, ignore_errors=True)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def link_or_copy(src, dst):
+    """Hardlink ``src`` to ``dst``, copying only when both are on different filesystems.
+
+    The tools in the containers only read their inputs, so sharing the inode with the
+    caller's file is safe.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
@@ -1,9 +1,9 @@
 from pddl_utils import Not
 from itertools import product
 import re
-from typing import Callable, Generator, Sequence, TypeVar
+from typing import TYPE_CHECKING, Callable, Generator, Iterator, Sequence, TypeVar
 from collections import defaultdict
-import numpy as np
+from functools import lru_cache
 from pddl_utils.structs.structs import (
     GroundAtom,
     GroundOperator,
@@ -15,14 +15,19 @@ from pddl_utils.structs.structs import (
     Type,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# A typed variable ``?x - type``; chained types (``?x - a - b``) are removed as a whole.
+_VARIABLE_TYPE_RE = re.compile(r"(\?\w+)(?: \- \w+)+")
+_TYPES_SECTION_RE = re.compile(r"\(:types [\w\W]+?\)*(\((?::constants|:predicates|:functions|:derived))")
+
 
 def transition(curr_state: frozenset[GroundAtom], effect: frozenset[GroundAtom]) -> frozenset[GroundAtom]:
     """Apply the effect to the current state and return the new state."""
-    new_state = set(curr_state)
-    for atom in effect:
-        new_state.discard(GroundAtom(atom.predicate.get_negation(), atom.objects))  # remove negation if present
-        new_state.add(atom)
-    return frozenset(new_state)
+    # Each effect atom replaces its negation, if present.
+    negations = {GroundAtom(atom.predicate.get_negation(), atom.objects) for atom in effect}
+    return frozenset(curr_state).difference(negations).union(effect)
 
 
 def get_predicate_evaluation(state: frozenset[GroundAtom]) -> dict[GroundAtom, bool]:
@@ -81,12 +86,28 @@ def get_effect(
 
 
 def get_substitutions(variables: Sequence[Variable], objects: frozenset[Object]) -> Generator[VarToObjSub, None, None]:
-    ll_objects_per_arg = [[obj for obj in sorted(objects) if obj.type == var.type] for var in variables]
-    for args in product(*ll_objects_per_arg):
-        substitution = {}
-        for variable, obj in zip(variables, args):
-            substitution[variable] = obj
-        yield substitution
+    for args in _object_tuples([var.type for var in variables], _sorted_objects_by_type(frozenset(objects))):
+        yield dict(zip(variables, args))
+
+
+@lru_cache(maxsize=32)
+def _sorted_objects_by_type(objects: frozenset[Object]) -> dict[Type, list[Object]]:
+    """The sorted objects of each type (exactly the type, not its subtypes).
+
+    Cached per object set, which stays the same across the operators and states of a
+    problem. Do not modify the returned dict.
+    """
+    objects_by_type: dict[Type, list[Object]] = defaultdict(list)
+    for obj in sorted(objects):
+        objects_by_type[obj.type].append(obj)
+    return dict(objects_by_type)
+
+
+def _object_tuples(
+    types: Sequence[Type], objects_by_type: dict[Type, list[Object]]
+) -> Iterator[tuple[Object, ...]]:
+    """The object tuples of ``get_substitutions``, by position instead of by variable."""
+    return product(*(objects_by_type.get(t, ()) for t in types))
 
 
 def complete_state_with_false_ground_atoms(
@@ -126,8 +147,10 @@ def complete_state_with_false_ground_atoms(
 def sample_ground_operator(
     objects: frozenset[Object], sym_state: frozenset[GroundAtom], operator: Operator
 ) -> Generator[GroundOperator, None, None]:
-    for sub in get_substitutions(operator.parameters, objects):
-        ground_op = operator.ground(tuple(sub[v] for v in operator.parameters), frozenset(sym_state))
+    # Frozen once for all groundings (``frozenset`` returns a frozenset argument itself).
+    state = frozenset(sym_state)
+    for args in _object_tuples([p.type for p in operator.parameters], _sorted_objects_by_type(frozenset(objects))):
+        ground_op = operator.ground(args, state)
 
         if not ground_op.preconditions:  # subset
             continue
@@ -139,26 +162,41 @@ T = TypeVar("T")
 
 
 def abstract_state(
-    predicates: set[Predicate], objects: frozenset[Object], x: T, classifier: Callable[[GroundAtom, T], np.ndarray]
+    predicates: set[Predicate],
+    objects: frozenset[Object],
+    x: T,
+    classifier: Callable[[GroundAtom, T], "np.ndarray"] | None,
+    *,
+    batch_classifier: Callable[[list[GroundAtom], T], "np.ndarray"] | None = None,
 ) -> set[GroundAtom]:
+    """Classify every grounding of ``predicates`` (over distinct objects) in ``x``.
+
+    ``classifier`` gives the probability of one atom. ``batch_classifier``, if given, is used
+    instead and called once per predicate with all its atoms, returning their probabilities
+    as an array. Atoms with a probability below 0.5 are negated.
+    """
+    assert classifier is not None or batch_classifier is not None, "A classifier must be given"
     state = set()
+    objects_by_type = _sorted_objects_by_type(frozenset(objects))
     for pred in predicates:
-        vars = [Variable(f"?var{i}", t) for i, t in enumerate(pred.types)]
-        for sub in get_substitutions(vars, objects):
-            objs = [sub[var] for var in vars]
-            obj_names = [obj.name for obj in objs]
-            if len(set(obj_names)) != len(obj_names):
-                continue  # skip if there are duplicate objects
-
-            ground = GroundAtom(pred, objs)
-            prob = classifier(ground, x)
-
-            if prob.item() < 0.5:
-                s_pred = pred.get_negation()
-            else:
-                s_pred = pred
+        # skip groundings with duplicate objects
+        candidates = [
+            GroundAtom(pred, objs)
+            for objs in _object_tuples(pred.types, objects_by_type)
+            if len({obj.name for obj in objs}) == len(objs)
+        ]
+        if batch_classifier is not None:
+            if not candidates:
+                continue
+            is_false = (batch_classifier(candidates, x).reshape(-1) < 0.5).tolist()
+        else:
+            assert classifier is not None
+            is_false = [classifier(ground, x).item() < 0.5 for ground in candidates]
 
-            state.add(GroundAtom(s_pred, objs))
+        negation = pred.get_negation()
+        state.update(
+            GroundAtom(negation, ground.entities) if false else ground for ground, false in zip(candidates, is_false)
+        )
     return state
 
 
@@ -172,12 +210,13 @@ def filter_state(
         else:
             return state
 
+    # A set for the per-atom name lookups, instead of scanning the list for each atom.
+    known_names = frozenset(known_predicates)
     filtered_state = set()
     for atom in state:
         assert isinstance(atom, GroundAtom)
-        if (inverse and atom.predicate.name not in known_predicates) or (
-            not inverse and atom.predicate.name in known_predicates
-        ):
+        # Keep the atoms with a known name, or the others if ``inverse``.
+        if (atom.predicate.name in known_names) != inverse:
             filtered_state.add(atom)
     return frozenset(filtered_state)
 
@@ -216,13 +255,8 @@ def get_predicates_in_state(state: set[GroundAtom]) -> set[Predicate]:
 
 def remove_types_from_domain(domain_str: str) -> str:
     """Remove types from the domain."""
-    while True:
-        match = re.search(r"(\?\w+) \- \w+", domain_str)
-        if match is None:
-            break
-        domain_str = domain_str[: match.start()] + match.group(1) + domain_str[match.end() :]
-
-    domain_str = re.sub(r"\(:types [\w\W]+?\)*(\((?::constants|:predicates|:functions|:derived))", r"\1", domain_str)
+    domain_str = _VARIABLE_TYPE_RE.sub(r"\1", domain_str)
+    domain_str = _TYPES_SECTION_RE.sub(r"\1", domain_str)
 
     return domain_str
 
@@ -1,7 +1,7 @@
 import logging
 from typing import List
 
-from pddl_utils import GroundAtom, Not, PDDLDomain, PDDLProblem, SasPlan, SasAction, Object
+from pddl_utils import GroundAtom, PDDLDomain, PDDLProblem, SasPlan, SasAction, Object
 from pddl_utils.structs.structs import LiftedAtom, LiteralConjunction
 
 logger = logging.getLogger(__name__)
@@ -23,12 +23,13 @@ def get_states(domain: PDDLDomain, problem: PDDLProblem, actions: SasPlan) -> li
 
         ground_op = operator.ground(objects, pre_state)
 
-        for effect in ground_op.effects:
-            post_state -= {Not(effect)}
-            post_state |= {effect}
+        # Each effect replaces its negation.
+        post_state.difference_update(ground_op.negated_effects)
+        post_state.update(ground_op.effects)
 
-        action_states.append(frozenset(post_state))
+        # One snapshot per action, both recorded and grounded against by the next action.
         pre_state = frozenset(post_state)
+        action_states.append(pre_state)
 
     return action_states
 
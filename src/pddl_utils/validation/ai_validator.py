@@ -1,4 +1,5 @@
 from pddl_utils import VAL
+from pddl_utils.validation.val import _plan_succeeded
 import logging
 import re
 from typing import Optional, Tuple
@@ -6,6 +7,29 @@ from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import time.
+_ATOM_ASSIGNMENT_RE = re.compile(r"(\([\w\-]+[\w ]*\)) to (false|true)")
+
+
+def _span_between(
+    text: str, opening: str, closing: str, *, last: bool, start: int = 0
+) -> Optional[tuple[int, int]]:
+    r"""Span of the text between the first ``opening`` and the next ``closing`` (the last one if ``last``).
+
+    What ``re.search(opening + r"([\w\W]*?)" + closing)`` matches (``([\w\W]+)``, greedy, if
+    ``last``), found with two substring scans: VAL's verbose output can be long, and the
+    regex retries the rest of the text for every candidate end. The search for ``opening``
+    begins at ``start``.
+    """
+    start = text.find(opening, start)
+    if start < 0:
+        return None
+    start += len(opening)
+    end = text.rfind(closing, start + 1) if last else text.find(closing, start)
+    if end < 0:
+        return None
+    return start, end
+
 
 class AIValidator(VAL):
 
@@ -15,11 +39,11 @@ class AIValidator(VAL):
         if not successful:
             assert not success, response
             if "Bad plan description" in response:
-                match = re.search("Type problem in action([\w\W]+)Bad plan", response)
+                span = _span_between(response, "Type problem in action", "Bad plan", last=True)
             else:
-                match = re.search("Plan Repair Advice:([\w\W]+)Failed plans:", response)
-            assert match is not None
-            repair_advice = match.group(1)
+                span = _span_between(response, "Plan Repair Advice:", "Failed plans:", last=True)
+            assert span is not None
+            repair_advice = response[span[0] : span[1]]
         else:
             repair_advice = None
         return successful, repair_advice
@@ -29,28 +53,30 @@ class AIValidator(VAL):
     ) -> Tuple[str, bool]:
         response, success = self._validate(domain=domain, problem=problem, plan=plan, options=options)
         if plan is not None:
-            failed_plan = "Failed plans:" in response
-            if not failed_plan:
-                assert success
-            success = success and not failed_plan
+            success = _plan_succeeded(success, response)
 
-        if not success and "Plan Repair Advice" in response:
+        # Where the advice is found, its span is searched for from there instead of from the start.
+        advice_at = response.find("Plan Repair Advice") if not success else -1
+        if advice_at >= 0:
             # repair_advice = re.findall(r".*Plan Repair Advice:(.*)Failed plans:.*", response)
-            repair_advice = re.findall(r"Plan Repair Advice:\n([\w\W]*?)\nFailed plans:", response)[0]
+            span = _span_between(response, "Plan Repair Advice:\n", "\nFailed plans:", last=False, start=advice_at)
+            assert span is not None
+            repair_advice = response[span[0] : span[1]]
             lines = repair_advice.strip().splitlines()
             assert len(lines) >= 2
 
             if "has an unsatisfied precondition" in lines[0] or "The goal is not satisfied" in lines[0]:
-                predicates = [re.findall(r"(\([\w\-]+[\w ]*\))", line) for line in lines[1:]]
-                predicates_new = [re.findall(r"(\([\w\-]+[\w ]*\)) to (false|true)", line) for line in lines[1:]]
-                assert len(predicates) == len(predicates_new)
+                predicates_new = [_ATOM_ASSIGNMENT_RE.findall(line) for line in lines[1:]]
                 predicates = [
                     p[0][0] if p[0][1] == "true" else ("(not %s)" % p[0][0]) for p in predicates_new if len(p) > 0
                 ]
                 predicate = ", ".join(predicates)
 
-                response = response.replace(
-                    repair_advice, ("Predicate that leads to unsatisfied precondition: %s\n" % predicate)
+                # Splice at the known span instead of searching the response for the advice again.
+                response = (
+                    response[: span[0]]
+                    + ("Predicate that leads to unsatisfied precondition: %s\n" % predicate)
+                    + response[span[1] :]
                 )
 
         return response, success
@@ -1,54 +1,64 @@
 import logging
 from pathlib import Path
 import shutil
-from tempfile import TemporaryDirectory
 from typing import Optional
 
-import docker
-from docker.errors import DockerException
+from pddl_utils.utils.docker_utils import LongLivedContainer, link_or_copy
 from pddl_utils.validation.val import VAL
 
 logger = logging.getLogger(__name__)
 
+VAL_IMAGE = "claudiusk/val:latest"
 
-class DockerVAL(VAL):
+
+class DockerVAL(LongLivedContainer, VAL):
+    """VAL running inside a long-lived ``claudiusk/val`` container.
+
+    See :class:`LongLivedContainer` for how the container is started and removed.
+    """
+
+    _IMAGE = VAL_IMAGE
 
     def __init__(self):
-        self.client = docker.from_env()
+        super().__init__()
+        self._validate_cmd: list[str] = []
 
-    def _is_docker_running(self) -> bool:
+    def _container_started(self, container):
+        # The image's entrypoint is the validator; it is replaced by ``sleep`` in the container,
+        # so it is prepended to every ``exec_run`` instead.
+        self._validate_cmd = list(container.image.attrs["Config"]["Entrypoint"] or [])
+
+    def _validate(
+        self, dom_file: str, prob_file: Optional[str], plan_file: Optional[str], *more_plan_files: str
+    ) -> tuple[bool, str]:
+        plan = Path(plan_file).read_text() if plan_file is not None else None
+        return self._validate_plan(dom_file, prob_file, plan, *(Path(f).read_text() for f in more_plan_files))
+
+    def _validate_plan(
+        self, dom_file: str, prob_file: Optional[str], plan: Optional[str], *more_plans: str
+    ) -> tuple[bool, str]:
+        # The plan is written into the mounted directory directly, without a temporary plan file.
+        container = self._get_container()
+        run_dir = self._make_run_dir()
         try:
-            self.client.ping()  # Sends a request to Docker to check if it's alive
-            return True
-        except DockerException:
-            return False
-
-    def _validate(self, dom_file: str, prob_file: Optional[str], plan_file: Optional[str]) -> tuple[bool, str]:
-        with TemporaryDirectory() as docker_dir:
-            docker_dir = Path(docker_dir)
-            domain_file = docker_dir / "domain.pddl"
-            shutil.copy(dom_file, domain_file)
-            options = "-v"
-            cmd = options + " /pddls/domain.pddl "
+            link_or_copy(dom_file, run_dir / "domain.pddl")
+            cmd = [*self._validate_cmd, "-v", "domain.pddl"]
             if prob_file is not None:
-                shutil.copy(prob_file, docker_dir / "problem.pddl")
-                cmd += "/pddls/problem.pddl "
+                link_or_copy(prob_file, run_dir / "problem.pddl")
+                cmd.append("problem.pddl")
 
-            if plan_file is not None:
+            if plan is not None:
                 assert prob_file is not None
-                shutil.copy(plan_file, docker_dir / "actions")
-                cmd += "/pddls/actions"
-
-            assert self._is_docker_running()
-            container = self.client.containers.run(
-                image="claudiusk/val:latest",
-                command=cmd,
-                volumes={docker_dir.absolute().as_posix(): {"bind": "/pddls", "mode": "rw"}},
-                detach=True,
-            )
-            result = container.wait()
-            response = container.logs().decode().strip()
-            success = result["StatusCode"] == 0
-            container.remove()
+                (run_dir / "actions").write_text(plan)
+                cmd.append("actions")
+                for i, more_plan in enumerate(more_plans, start=1):
+                    (run_dir / f"actions_{i}").write_text(more_plan)
+                    cmd.append(f"actions_{i}")
+
+            exit_code, output = container.exec_run(cmd, workdir=f"/pddls/{run_dir.name}")
+            response = output.decode().strip()
+            success = exit_code == 0
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
 
         return success, response
@@ -1,6 +1,8 @@
+import fcntl
 import logging
 import os
 import subprocess
+from pathlib import Path
 from typing import Optional
 
 from pddl_utils.validation.val import VAL
@@ -8,6 +10,7 @@ from pddl_utils.validation.val import VAL
 logger = logging.getLogger(__name__)
 
 VAL_URL = "https://github.com/KCL-Planning/VAL.git"
+VAL_COMMIT = "a5565396007eee73ac36527fbf904142b3077c74"
 
 
 class LocalVAL(VAL):
@@ -21,29 +24,50 @@ class LocalVAL(VAL):
         if not os.path.exists(self._exec):
             self._install_val()
 
-    def _validate(self, dom_file: str, prob_file: Optional[str], plan_file: Optional[str]) -> tuple[bool, str]:
+    def _validate(
+        self, dom_file: str, prob_file: Optional[str], plan_file: Optional[str], *more_plan_files: str
+    ) -> tuple[bool, str]:
         """PDDL-specific planning method."""
-        cmd_str = "{} -v {}".format(self._exec, dom_file)
+        # Run VAL directly, without a shell in between (and safe for paths with spaces).
+        argv = [self._exec, "-v", dom_file]
         if prob_file is not None:
-            cmd_str += " {}".format(prob_file)
+            argv.append(prob_file)
         if plan_file is not None:
-            cmd_str += " {}".format(plan_file)
-        
-        result = subprocess.run(cmd_str, shell=True, capture_output=True, text=True)
+            argv.append(plan_file)
+            argv.extend(more_plan_files)
+
+        result = subprocess.run(argv, capture_output=True, text=True, check=False)
         output = result.stdout + result.stderr
         success = result.returncode == 0
         return success, output.strip()
 
     def _install_val(self):
         loc = os.path.dirname(self._exec)
-        # Install and compile VAL.
-        if not os.path.exists(loc):
-            res_code = os.system("git clone {} {}".format(VAL_URL, loc))
-            assert res_code == 0, "Could not clone VAL from {}".format(VAL_URL)
-        res_code = os.system(
-            "cd {} && git checkout a5565396007eee73ac36527fbf904142b3077c74 &&  make clean && sed -i 's/-Werror //g' Makefile && make && cd -".format(
-                loc
-            )
-        )
-        assert res_code == 0, "Could not build VAL in {}. Did you install bison and flex?".format(loc)
+        # Validators constructed concurrently (e.g. by parallel test workers) install VAL only once:
+        # the first one builds it under the lock, the others find the binary when they get the lock.
+        with open(loc + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if not os.path.exists(self._exec):
+                self._build_val(loc)
         assert os.path.exists(self._exec)
+
+    def _build_val(self, loc: str):
+        # Install and compile VAL, running each step directly instead of through a shell.
+        if not os.path.exists(loc):
+            res = subprocess.run(["git", "clone", VAL_URL, loc], check=False)
+            assert res.returncode == 0, "Could not clone VAL from {}".format(VAL_URL)
+        error = "Could not build VAL in {}. Did you install bison and flex?".format(loc)
+
+        # An interrupted build of the pinned commit is resumed; only a checkout invalidates its objects.
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=loc, capture_output=True, text=True, check=False)
+        if head.stdout.strip() != VAL_COMMIT:
+            for step in (["git", "checkout", VAL_COMMIT], ["make", "clean"]):
+                assert subprocess.run(step, cwd=loc, check=False).returncode == 0, error
+
+        makefile = Path(loc) / "Makefile"
+        text = makefile.read_text()
+        if "-Werror " in text:
+            makefile.write_text(text.replace("-Werror ", ""))
+
+        res = subprocess.run(["make", f"-j{os.cpu_count() or 1}"], cwd=loc, check=False)
+        assert res.returncode == 0, error
@@ -1,25 +1,36 @@
+import hashlib
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import NamedTemporaryFile
-from typing import Optional
+from typing import Optional, Sequence, Union
+
+# Number of validation results kept by ``VAL.validate``.
+_RESULT_CACHE_SIZE = 1024
+
+# VAL's verbose output starts one section per plan with this line and ends with a summary.
+_PLAN_HEADER = "Checking plan:"
+_SUMMARY_HEADERS = ("\nSuccessful plans:", "\nFailed plans:")
 
 
 class VAL:
     """VAL validator"""
 
+    # Results by validator class and a digest of the domain, problem and cleaned plan,
+    # shared by all instances so that repeated validations of the same inputs skip VAL.
+    _result_cache: "OrderedDict[tuple, tuple[bool, str]]" = OrderedDict()
+    _result_cache_lock = threading.Lock()
+
     def validate(self, dom_file: str, prob_file: Optional[str], plan_file: Optional[str], remove_files=False) -> tuple[bool, str]:
-        if plan_file is not None:
-            tmp_plan_f = NamedTemporaryFile(mode='w', delete=False)
-            tmp_plan_f .close()
-            with open(plan_file, 'r') as f_in, open(tmp_plan_f.name, 'w') as f_out:
-                for line in f_in:
-                    if not line.strip().startswith(';') and line.strip() != '':
-                        f_out.write(line)
-            tmp_plan_file = tmp_plan_f.name
-        else:
-            tmp_plan_file = None
-        success, output = self._validate(dom_file, prob_file, tmp_plan_file)
-        if tmp_plan_file is not None:
-            os.remove(tmp_plan_file)
+        plan = _clean_plan(plan_file) if plan_file is not None else None
+
+        # Files that are removed afterwards are not expected to be validated again.
+        key = None if remove_files else (type(self), _inputs_digest(dom_file, prob_file, plan))
+        if key is not None and (cached := self._cached_result(key)) is not None:
+            return cached
+
+        success, output = self._validate_plan(dom_file, prob_file, plan)
         if remove_files:
             os.remove(dom_file)
             if prob_file is not None:
@@ -28,12 +39,130 @@ class VAL:
                 os.remove(plan_file)
 
         if plan_file is not None:
-            failed_plan = "Failed plans:" in output
-            if not failed_plan:
-                assert success
-            success = success and not failed_plan
+            success = _plan_succeeded(success, output)
 
+        if key is not None:
+            self._cache_result(key, (success, output))
         return success, output
 
-    def _validate(self, dom_file: str, prob_file: Optional[str], plan_file: Optional[str]) -> tuple[bool, str]:
+    def validate_many(self, dom_file: str, prob_file: str, plan_files: list[str]) -> list[tuple[bool, str]]:
+        """``validate`` for several plans of one problem, checked by a single VAL run.
+
+        VAL accepts many plans per domain and problem; its output is split into the plans'
+        sections, each prefixed with the domain and problem messages (the final summary is
+        dropped). Should the sections not line up with the plans, e.g. because the domain or
+        problem is rejected, every plan is validated on its own instead.
+        """
+        plans = [_clean_plan(plan_file) for plan_file in plan_files]
+        keys = [(type(self), _inputs_digest(dom_file, prob_file, plan)) for plan in plans]
+        # Sections lack the summary of a single run, so they are cached apart from ``validate``'s results.
+        results = [self._cached_result(key) or self._cached_result((*key, _PLAN_HEADER)) for key in keys]
+        todo = [i for i, result in enumerate(results) if result is None]
+        if len(todo) > 1:
+            _, output = self._validate_plan(dom_file, prob_file, *(plans[i] for i in todo))
+            sections = _plan_sections(output)
+            if sections is not None and len(sections) == len(todo):
+                for i, section in zip(todo, sections):
+                    results[i] = ("Plan valid" in section, section)
+                    self._cache_result((*keys[i], _PLAN_HEADER), results[i])
+        return [result if result is not None else self.validate(dom_file, prob_file, plan_file)
+                for result, plan_file in zip(results, plan_files)]
+
+    def validate_parallel(
+        self,
+        specs: Sequence[tuple[str, Optional[str], Optional[str]]],
+        max_workers: int | None = None,
+    ) -> list[Union[tuple[bool, str], Exception]]:
+        """Validate independent (domain file, problem file, plan file) triples concurrently.
+
+        VAL runs as a separate process (or in the container), so a thread pool is enough to
+        keep several validations busy. The result list follows the order of ``specs``; a
+        validation that fails contributes its exception instead of a result.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.validate, *spec) for spec in specs]
+        results: list[Union[tuple[bool, str], Exception]] = []
+        for future in futures:
+            exception = future.exception()
+            results.append(future.result() if exception is None else exception)
+        return results
+
+    def _cached_result(self, key: tuple) -> Optional[tuple[bool, str]]:
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+            return result
+
+    def _cache_result(self, key: tuple, result: tuple[bool, str]):
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _validate_plan(
+        self, dom_file: str, prob_file: Optional[str], plan: Optional[str], *more_plans: str
+    ) -> tuple[bool, str]:
+        """``_validate`` with the cleaned plans as text, written to temporary plan files.
+
+        Subclasses that copy the plans anyway override this to write the text there directly.
+        """
+        if plan is None:
+            return self._validate(dom_file, prob_file, None)
+        tmp_plan_files = []
+        try:
+            for text in (plan, *more_plans):
+                with NamedTemporaryFile(mode='w', delete=False) as tmp_plan_f:
+                    tmp_plan_files.append(tmp_plan_f.name)
+                    tmp_plan_f.write(text)
+            return self._validate(dom_file, prob_file, *tmp_plan_files)
+        finally:
+            for tmp_plan_file in tmp_plan_files:
+                os.remove(tmp_plan_file)
+
+    def _validate(
+        self, dom_file: str, prob_file: Optional[str], plan_file: Optional[str], *more_plan_files: str
+    ) -> tuple[bool, str]:
         raise NotImplementedError("Subclasses must implement this method")
+
+
+def _plan_succeeded(success: bool, output: str) -> bool:
+    """Whether VAL accepted the plan; a plan listed under "Failed plans:" fails whatever the exit code."""
+    failed_plan = "Failed plans:" in output
+    if not failed_plan:
+        assert success
+    return success and not failed_plan
+
+
+def _clean_plan(plan_file: str) -> str:
+    """The plan without comments and blank lines, telling both apart by the left-stripped line only."""
+    with open(plan_file, 'r') as f_in:
+        return "".join(line for line in f_in if (stripped := line.lstrip()) and not stripped.startswith(';'))
+
+
+def _plan_sections(output: str) -> Optional[list[str]]:
+    """The per-plan sections of VAL's verbose output, each prefixed with the text before the first one."""
+    parts = output.split(_PLAN_HEADER)
+    if len(parts) < 2:
+        return None
+    preamble, sections = parts[0], parts[1:]
+    last = sections[-1]
+    for header in _SUMMARY_HEADERS:
+        end = last.find(header)
+        if end >= 0:
+            last = last[:end]
+    sections[-1] = last
+    return [(preamble + _PLAN_HEADER + section).strip() for section in sections]
+
+
+def _inputs_digest(dom_file: str, prob_file: Optional[str], plan: Optional[str]) -> bytes:
+    """Digest of the validated contents; a missing problem or plan hashes differently from an empty one."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(dom_file, 'rb') as f:
+        digest.update(f.read())
+    if prob_file is not None:
+        with open(prob_file, 'rb') as f:
+            digest.update(b"\0P" + f.read())
+    if plan is not None:
+        digest.update(b"\0A" + plan.encode())
+    return digest.digest()
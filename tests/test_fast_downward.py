@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from pddl_utils import LocalFastDownward, DockerFastDownward
+from pddl_utils.planning.pddl_planner import PDDLPlanner
 from pddl_utils.planning.planner import PlanningFailure
 
 
@@ -41,3 +44,39 @@ class TestFastDownward:
         planner = planner_class()
         with pytest.raises(PlanningFailure):
             planner.plan_from_pddl(simple_domain, impossible_problem)
+
+    def test_plan_many(self, planner_class, simple_domain, simple_problem):
+        """Test planning a batch of problems against one domain."""
+        planner = planner_class()
+        plans = planner.plan_many_from_pddl(simple_domain, [simple_problem, simple_problem])
+
+        assert len(plans) == 2
+        assert all(len(plan) == 4 for plan in plans)
+        assert str(plans[0]) == str(plans[1])
+
+    def test_plan_parallel(self, planner_class, simple_domain, simple_problem, impossible_problem):
+        """Test planning independent problems concurrently."""
+        planner = planner_class()
+        results = planner.plan_parallel(
+            [(simple_domain, simple_problem), (simple_domain, impossible_problem), (simple_domain, simple_problem)]
+        )
+
+        assert len(results) == 3
+        assert isinstance(results[1], PlanningFailure)
+        assert str(results[0]) == str(results[2])
+        assert planner.get_statistics()["plan_length"] == 4
+
+
+def test_statistics_merge_concurrently():
+    """Concurrent calls add up their node expansions without losing updates."""
+    output = "Solution found!\nPlan length: 4 step(s).\n[t=0.01s] Plan cost: 4\nEvaluated 3 state(s).\n"
+    planner = PDDLPlanner()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(2000):
+            executor.submit(planner._parse_statistics, output)
+
+    stats = planner.get_statistics()
+    assert stats["num_node_expansions"] == 2000 * 3
+    assert stats["plan_length"] == 4
+    assert stats["plan_cost"] == 4
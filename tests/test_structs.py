@@ -0,0 +1,54 @@
+from pddl_utils import parse_domain, parse_problem
+from pddl_utils.structs.structs import LiteralDisjunction, Type, Variable
+
+DOMAIN = """
+(define (domain formulas)
+  (:types block)
+  (:predicates (on ?x - block ?y - block) (clear ?x - block))
+  (:action act
+    :parameters (?a - block ?b - block)
+    :precondition (and (or (clear ?a) (on ?a ?b)) (exists (?c - block) (or (on ?c ?a) (clear ?c))))
+    :effect (and (forall (?d - block) (when (on ?d ?a) (clear ?d))) (not (clear ?b)))
+  )
+)
+"""
+
+
+def test_exposed_variables_are_variables():
+    """Every formula exposes its free variables as a frozenset of Variables."""
+    operator = parse_domain(DOMAIN).get_operator_by_name("act")
+    parameters = set(operator.parameters)
+
+    formulas = [operator.preconditions, operator.effects, *operator.preconditions.literals]
+    for formula in formulas:
+        assert isinstance(formula.exposed_variables, frozenset)
+        assert all(isinstance(v, Variable) for v in formula.exposed_variables)
+        assert formula.exposed_variables <= parameters
+
+    disjunction = next(lit for lit in operator.preconditions.literals if isinstance(lit, LiteralDisjunction))
+    assert disjunction.exposed_variables == parameters
+
+
+def test_exists_with_conjunctive_body():
+    """Existentials over conjunctions find witnesses that need every variable bound."""
+    domain = parse_domain(DOMAIN)
+    problem = parse_problem(
+        """(define (problem p) (:domain formulas) (:objects a b c - block)
+        (:init (on a b) (on b c) (clear a))
+        (:goal (exists (?x - block ?y - block ?z - block) (and (on ?x ?y) (on ?y ?z) (clear ?x)))))""",
+        domain,
+    )
+    assert problem.goal.evaluate({}, problem.init)
+    assert not problem.goal.evaluate({}, frozenset(a for a in problem.init if a.predicate.name != "clear"))
+
+
+def test_interned_type_keeps_its_features():
+    """Constructing an interned type again does not rebind the shared instance's fields."""
+    features = ["x"]
+    block = Type("interned_block", features)
+    features.append("y")
+
+    again = Type("interned_block", ["x"])
+    assert again is block
+    assert block.feature_names == ("x",)
+    assert str(block) == "interned_block:('x',)"
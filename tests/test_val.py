@@ -1,6 +1,44 @@
 import pytest
 
 from pddl_utils import LocalVAL, DockerVAL
+from pddl_utils.validation.val import _plan_sections
+
+# Verbose VAL output for two plans of one problem, the first valid, the second not.
+TWO_PLANS_OUTPUT = """Checking plan: actions
+Plan to validate:
+
+Plan size: 4
+1:
+(pick-up b)
+Plan Validation details
+-----------------------
+Plan executed successfully - checking goal
+Plan valid
+Final value: 4
+
+Checking plan: actions_1
+Plan to validate:
+
+Plan size: 2
+1:
+(stack a b)
+Plan Validation details
+-----------------------
+Plan failed because of unsatisfied precondition in:
+(stack a b)
+Plan failed to execute
+
+Plan Repair Advice:
+
+(stack a b) has an unsatisfied precondition at time 1
+(Set (holding a) to true)
+
+Successful plans:
+ Value: 4
+ actions 4
+
+Failed plans:
+ actions_1 1"""
 
 
 @pytest.mark.parametrize("validator_class", [LocalVAL, DockerVAL])
@@ -22,3 +60,43 @@ class TestVAL:
         gt_output = "(Set (holding a) to true)"
         assert gt_output in output
         assert not success
+
+    def test_validate_many(self, validator_class, simple_domain, simple_problem, valid_plan, invalid_plan):
+        """Test validating several plans of one problem in a single VAL run."""
+        validator = validator_class()
+        results = validator.validate_many(simple_domain, simple_problem, [valid_plan, invalid_plan])
+
+        assert [success for success, _ in results] == [True, False]
+        for plan_file, (success, _) in zip([valid_plan, invalid_plan], results):
+            assert success == validator.validate(simple_domain, simple_problem, plan_file)[0]
+        assert "(Set (holding a) to true)" in results[1][1]
+
+    def test_validate_parallel(self, validator_class, simple_domain, simple_problem, valid_plan, invalid_plan):
+        """Test validating independent triples concurrently."""
+        validator = validator_class()
+        results = validator.validate_parallel(
+            [
+                (simple_domain, simple_problem, valid_plan),
+                (simple_domain, simple_problem, "missing_plan.txt"),
+                (simple_domain, simple_problem, invalid_plan),
+            ]
+        )
+
+        assert len(results) == 3
+        assert results[0][0]
+        assert isinstance(results[1], FileNotFoundError)
+        assert not results[2][0]
+
+
+def test_plan_sections():
+    """Test splitting verbose VAL output into one section per plan."""
+    sections = _plan_sections(TWO_PLANS_OUTPUT)
+
+    assert sections is not None and len(sections) == 2
+    assert sections[0].startswith("Checking plan: actions\n")
+    assert "Plan valid" in sections[0] and "Plan failed" not in sections[0]
+    assert sections[1].startswith("Checking plan: actions_1\n")
+    assert "Plan valid" not in sections[1]
+    assert sections[1].endswith("(Set (holding a) to true)")
+    assert all("Successful plans:" not in s and "Failed plans:" not in s for s in sections)
+    assert _plan_sections("Error: Parser failed to read file!") is None